@@ -1,9 +1,17 @@
-import sys, os, re, time, qrcode, numpy as np, cv2, imagehash, tempfile, shutil, ctypes
+import sys, os, re, time, qrcode, numpy as np, cv2, imagehash, tempfile, shutil, ctypes, struct
+import abc
 import traceback
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import json
 import webbrowser
 import urllib.request
 from PIL import Image, ImageDraw, ImageFont, ImageOps
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
@@ -11,11 +19,49 @@ from PySide6.QtGui import *
 # 기본 설정
 OUTPUT_FOLDER = os.path.join(tempfile.gettempdir(), f"ScoreCapturePro_{os.getpid()}")  # 임시 폴더 경로
 DEFAULT_SENSITIVITY = "0.9"        # 이미지 변화 감지 민감도 (SSIM 임계값)
+CHANGE_GRID_BLOCK = 64             # 변화 감지 블록 크기 (px)
+CHANGE_BLOCK_FRACTION = 0.05       # 변경된 블록 비율이 이 값 이상이면 페이지 넘김으로 판정
+CHANGE_DETECT_WORKERS = max(1, os.cpu_count() or 1)  # 블록 SSIM 병렬 계산 스레드 수
 DEFAULT_DELAY = "3"                # 캡처 시작 전 카운트다운 (초)
+CAPTURE_INTERVAL_MS = 1000         # 캡처 시작 시 기본 주기 (ms)
+CAPTURE_INTERVAL_MIN_MS = 200      # 화면이 변하는 중일 때 최소 주기 (ms)
+CAPTURE_INTERVAL_MAX_MS = 2000     # 화면이 멈춰 있을 때 최대 주기 (ms)
+CAPTURE_CPU_BUDGET = 0.5           # 캡처 처리에 쓸 수 있는 시간 비율 (0.5 = 주기의 50%)
+FRAME_QUEUE_SIZE = 4               # 워커 처리 대기 프레임 최대 개수
+FRAME_QUEUE_POLICY = "latest"      # 큐가 찼을 때 정책 ('drop_oldest', 'drop_newest', 'latest')
+PERSIST_QUEUE_SIZE = 8             # 저장 단계 대기 최대 개수 (가득 차면 분석 단계가 대기)
+PERSIST_FLUSH_TIMEOUT = 30.0       # 편집/내보내기/종료 전 저장 대기 최대 시간 (초, 넘으면 메모리 이미지로 진행)
+CAPTURE_STORE_EXT = ".scz"         # 캡처 저장소 형식 확장자 (zstd 압축 원시 픽셀)
+CAPTURE_STORE_LEVEL = 3            # 캡처 저장소 zstd 압축 수준
+SCROLL_TEMPLATE_WIDTH = 200        # 스크롤 이어붙이기 기준 템플릿 너비 (px, 꼬리 버퍼는 이 2배)
+SCROLL_TEMPLATE_MIN_WIDTH = 64     # 질감이 충분할 때 쓰는 가장 좁은 템플릿 너비 (px)
+SCROLL_TEXTURE_EDGE = 32           # 이 이상의 가로 밝기 차이를 가로 경계 화소로 봄
+SCROLL_TEXTURE_PIXELS = 2          # 가로 경계 화소가 이 수 이상인 열을 질감 있는 열로 봄 (행 2개당 1개 표본)
+SCROLL_TEMPLATE_MIN_TEXTURE = 24   # 템플릿에 들어가야 하는 질감 있는 열 수 (부족하면 너비를 넓힘)
+SCROLL_MATCH_THRESHOLD = 0.7       # 전체 폭 템플릿 매칭 채택 최소 점수
+SCROLL_PREDICT_CONFIDENCE = 0.9    # 예측 구간 매칭 채택 최소 점수 (미만이면 전체 폭 재탐색)
+SCROLL_SEARCH_MARGIN = 48          # 예측 위치 좌우 탐색 여유 (px)
+SCROLL_ALIGN_MODE = "pyramid"      # 정렬 방식: pyramid(축소 영상에서 추정 후 원본에서 보정) / direct(원본 전체)
+SCROLL_PYRAMID_LEVELS = 2          # 피라미드 축소 단계 (2 → 1/4 크기)
+SCROLL_REFINE_RADIUS = 3           # 원본 해상도 보정 시 추정 위치 좌우 여유 (px)
+SCROLL_STITCH_ENGINE = "template"  # 이동량 추정 엔진: template(템플릿 매칭) / phase(위상 상관, 탐색 범위와 무관한 비용)
+SCROLL_PHASE_MIN_RESPONSE = 0.1    # 위상 상관 정점 응답 최소값 (미만이면 템플릿 매칭으로 전환)
+FRAME_FINGERPRINT_SIZE = (128, 64) # 동일 프레임 판정용 축소 지문 크기 (너비, 높이)
+SCROLL_RECOVERY_BUDGET_MS = 40     # 정렬 실패 시 복구 단계(대체 꼬리 영역, ORB)에 쓸 프레임당 시간 예산
+SCROLL_ORB_FEATURES = 500          # ORB 복구 단계 특징점 수
+SCROLL_ORB_MIN_INLIERS = 12        # ORB 대응 중 같은 이동량에 모여야 하는 최소 개수
+SCROLL_LOST_SYNC_FRAMES = 3        # 연속 정렬 실패가 이 횟수에 이르면 동기화 잃음 → 현재 화면으로 다시 시작
+STRIP_SEGMENT_COLUMNS = 4096       # 스크롤 스트립 저장소 세그먼트 파일당 열(px) 수
+DUPLICATE_HASH_DISTANCE = 5        # 이 해밍 거리 이하의 pHash는 이미 저장한 페이지로 간주 (64비트 기준)
 DEFAULT_MARGIN = "60"              # PDF 생성 시 페이지 여백 (px)
 DEFAULT_SPACING = "40"             # PDF 생성 시 이미지 간 간격 (px)
 DEFAULT_OPACITY = 100              # 프로그램 창 기본 투명도 (100 = 불투명)
 MIN_OPACITY = 20                   # 프로그램 창 최소 투명도
+SR_MODEL_MEMORY_LIMIT_MB = 512     # 초해상도 모델 풀 메모리 상한 (MB)
+SR_MODEL_IDLE_TIMEOUT = 300        # 사용하지 않는 초해상도 모델 해제 시간 (초)
+ENHANCE_MAX_WORKERS = max(1, (os.cpu_count() or 2) // 2)  # 화질 개선 병렬 작업 수
+SR_TILE_MEMORY_BUDGET_MB = 256     # 동시에 실행되는 업스케일 추론 전체의 최대 메모리 예산 (MB)
+SR_TILE_OVERLAP = 16               # 타일 간 겹침 폭 (원본 px, 경계 블렌딩 구간)
 
 # 리소스 경로
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -58,17 +104,99 @@ def load_version_info():
 
 VERSION_INFO = load_version_info()
 
+class PendingWrites:
+    """쓰기 대기 중인 이미지 레지스트리 (경로 → 배열, 스레드 안전)
+
+    write-behind 저장 중인 파일은 디스크 대신 메모리 이미지를 바로 읽을 수 있게 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._images = {}
+
+    def add(self, path, img):
+        with self._lock:
+            self._images[path] = img
+
+    def get(self, path):
+        with self._lock:
+            return self._images.get(path)
+
+    def discard(self, path, img):
+        """쓰기 완료 시 제거 (그 사이 같은 경로로 새 이미지가 등록됐으면 유지, 제거했으면 True)"""
+        with self._lock:
+            if self._images.get(path) is img:
+                del self._images[path]
+                return True
+            return False
+
+    def cancel(self, path):
+        """삭제된 페이지의 쓰기 취소 (저장 단계는 등록이 없어진 경로를 쓰지 않음)"""
+        with self._lock:
+            self._images.pop(path, None)
+
+PENDING_WRITES = PendingWrites()
+
+# 캡처 저장소 헤더: 매직, 버전, 픽셀 형식(0=BGR, 1=회색조), 높이, 너비
+CAPTURE_STORE_MAGIC = b"SCZ"
+CAPTURE_STORE_HEADER = struct.Struct("<3sBBII")
+CAPTURE_STORE_BGR, CAPTURE_STORE_GRAY = 0, 1
+
+def is_capture_store_path(path):
+    return os.path.splitext(path)[1].lower() == CAPTURE_STORE_EXT
+
+def encode_capture_store(img):
+    """BGR 이미지를 캡처 저장소 형식(헤더 + zstd 원시 픽셀)으로 인코딩
+
+    세 채널이 모두 같으면(흑백 악보) 한 채널만 저장합니다.
+    """
+    h, w = img.shape[:2]
+    b, g, r = img[:, :, 0], img[:, :, 1], img[:, :, 2]
+    if np.array_equal(b, g) and np.array_equal(g, r):
+        pixel_format, pixels = CAPTURE_STORE_GRAY, np.ascontiguousarray(b)
+    else:
+        pixel_format, pixels = CAPTURE_STORE_BGR, np.ascontiguousarray(img)
+    header = CAPTURE_STORE_HEADER.pack(CAPTURE_STORE_MAGIC, 1, pixel_format, h, w)
+    return header + zstandard.ZstdCompressor(level=CAPTURE_STORE_LEVEL).compress(pixels.data)
+
+def decode_capture_store(data):
+    """캡처 저장소 형식을 BGR 이미지로 디코딩"""
+    magic, version, pixel_format, h, w = CAPTURE_STORE_HEADER.unpack_from(data)
+    if magic != CAPTURE_STORE_MAGIC or version != 1:
+        raise ValueError("캡처 저장소 형식이 아닙니다.")
+    channels = 1 if pixel_format == CAPTURE_STORE_GRAY else 3
+    raw = zstandard.ZstdDecompressor().decompress(data[CAPTURE_STORE_HEADER.size:], max_output_size=h * w * channels)
+    pixels = np.frombuffer(raw, np.uint8)
+    if pixel_format == CAPTURE_STORE_GRAY:
+        return cv2.cvtColor(pixels.reshape(h, w), cv2.COLOR_GRAY2BGR)
+    return pixels.reshape(h, w, 3).copy()  # bytes 기반 배열은 읽기 전용이므로 쓰기 가능한 사본
+
+def image_exists(path):
+    """디스크에 있거나 쓰기 대기 중(PENDING_WRITES)인 이미지인지 확인"""
+    return os.path.exists(path) or PENDING_WRITES.get(path) is not None
+
 def imread_unicode(path):
-    """한글 경로 지원 이미지 읽기"""
+    """한글 경로 지원 이미지 읽기 (쓰기 대기 중이면 메모리 이미지 사본 반환)"""
+    pending = PENDING_WRITES.get(path)
+    if pending is not None:
+        return pending.copy()
     try:
+        if is_capture_store_path(path):
+            with open(path, mode='rb') as f:
+                return decode_capture_store(f.read())
         stream = np.fromfile(path, np.uint8)
         return cv2.imdecode(stream, cv2.IMREAD_COLOR)
     except Exception:
         return None
 
 def imwrite_unicode(path, img):
-    """한글 경로 지원 이미지 쓰기"""
+    """한글 경로 지원 이미지 쓰기 (.scz는 캡처 저장소 형식)"""
     try:
+        if is_capture_store_path(path):
+            data = encode_capture_store(img)
+            with open(path, mode='wb') as f:
+                f.write(data)
+            return True
         ext = os.path.splitext(path)[1]
         result, n = cv2.imencode(ext, img)
         if result:
@@ -78,6 +206,22 @@ def imwrite_unicode(path, img):
         return False
     except Exception:
         return False
+
+def load_qpixmap(path):
+    """이미지 파일을 QPixmap으로 로드 (캡처 저장소 형식 포함)"""
+    if is_capture_store_path(path) or PENDING_WRITES.get(path) is not None:
+        img = imread_unicode(path)
+        return cv2_to_qpixmap(img) if img is not None else QPixmap()
+    return QPixmap(path)
+
+def load_pil_image(path):
+    """이미지 파일을 PIL RGB 이미지로 로드 (캡처 저장소 형식, 쓰기 대기 중인 이미지 포함)"""
+    if is_capture_store_path(path) or PENDING_WRITES.get(path) is not None:
+        img = imread_unicode(path)
+        if img is None:
+            raise IOError(f"이미지를 읽을 수 없습니다: {path}")
+        return cv2_to_pil(img)
+    return Image.open(path).convert("RGB")
     
 def cleanup_old_temp_folders():
     """실행 시 이전 실행에서 남은 임시 폴더 정리"""
@@ -1008,43 +1152,97 @@ def show_message(parent, title, text, icon=QMessageBox.Icon.Information, buttons
     apply_window_theme(msg, parent)
     return msg.exec()
 
-def grab_screen_area(x, y, w, h):
-    """멀티 모니터 지원 화면 캡처"""
-    screens = QApplication.screens()
-    target_rect = QRect(x, y, w, h)
-    
-    # 캡처 영역의 중심이 있는 화면의 DPR을 구함 (HiDPI 지원)
-    center = target_rect.center()
-    target_screen = screens[0]
-    for screen in screens:
-        if screen.geometry().contains(center):
-            target_screen = screen
-            break
-    dpr = target_screen.devicePixelRatio()
-
-    # 물리 픽셀 크기로 Pixmap 생성 후 DPR 설정 (고해상도 유지)
-    res_pixmap = QPixmap(int(w * dpr), int(h * dpr))
-    res_pixmap.setDevicePixelRatio(dpr)
-    res_pixmap.fill(Qt.black)
-    
-    painter = QPainter(res_pixmap)
-    
-    for screen in screens:
-        geo = screen.geometry()
-        intersect = geo.intersected(target_rect)
-        
-        if not intersect.isEmpty():
-            local_x = intersect.x() - geo.x()
-            local_y = intersect.y() - geo.y()
-            
-            grab = screen.grabWindow(0, local_x, local_y, intersect.width(), intersect.height())
-            
-            dest_x = intersect.x() - x
-            dest_y = intersect.y() - y
-            painter.drawPixmap(dest_x, dest_y, grab)
-            
-    painter.end()
-    return res_pixmap
+class CapturePlan:
+    """캡처 영역에 대해 미리 계산된 멀티 모니터 캡처 계획
+
+    영역과 겹치는 화면 조각, DPR, 대상 오프셋, 합성용 Pixmap을 한 번만 계산해 두고
+    매 틱에는 grabWindow와 그리기만 수행합니다. 영역이 한 화면 안에 있으면 합성을 생략합니다.
+    화면 구성이 바뀌면 새로 만들어야 합니다.
+    """
+
+    def __init__(self, x, y, w, h):
+        self.rect = QRect(x, y, w, h)
+        screens = QApplication.screens()
+
+        # 캡처 영역의 중심이 있는 화면의 DPR을 구함 (HiDPI 지원)
+        center = self.rect.center()
+        target_screen = screens[0]
+        for screen in screens:
+            if screen.geometry().contains(center):
+                target_screen = screen
+                break
+        self.dpr = target_screen.devicePixelRatio()
+
+        # (화면, 화면 내 로컬 영역, 대상 위치) 조각 목록
+        self.fragments = []
+        covered = 0
+        for screen in screens:
+            geo = screen.geometry()
+            intersect = geo.intersected(self.rect)
+            if intersect.isEmpty():
+                continue
+            local = intersect.translated(-geo.x(), -geo.y())
+            dest = QPoint(intersect.x() - x, intersect.y() - y)
+            self.fragments.append((screen, local, dest))
+            covered += intersect.width() * intersect.height()
+
+        # 단일 화면이 영역 전체를 덮으면 grabWindow 결과를 그대로 사용
+        self.single = len(self.fragments) == 1 and covered == w * h
+        self.canvas = None
+        if not self.single:
+            # 물리 픽셀 크기로 Pixmap 생성 후 DPR 설정 (고해상도 유지)
+            # 화면 밖 영역은 한 번만 검게 채워 두고 조각 부분만 매번 덮어씀
+            self.canvas = QPixmap(int(w * self.dpr), int(h * self.dpr))
+            self.canvas.setDevicePixelRatio(self.dpr)
+            self.canvas.fill(Qt.black)
+
+    def matches(self, x, y, w, h):
+        return self.rect == QRect(x, y, w, h)
+
+    def grab(self):
+        if self.single:
+            screen, local, _ = self.fragments[0]
+            return screen.grabWindow(0, local.x(), local.y(), local.width(), local.height())
+
+        painter = QPainter(self.canvas)
+        for screen, local, dest in self.fragments:
+            grab = screen.grabWindow(0, local.x(), local.y(), local.width(), local.height())
+            painter.drawPixmap(dest, grab)
+        painter.end()
+        # 반환된 Pixmap은 암시적 공유되므로 다음 그리기 시 분리(detach)되어 호출자 사본은 유지됨
+        return QPixmap(self.canvas)
+
+def grab_screen_area(x, y, w, h, plan=None):
+    """멀티 모니터 지원 화면 캡처 (plan이 영역과 일치하면 재사용)"""
+    if plan is None or not plan.matches(x, y, w, h):
+        plan = CapturePlan(x, y, w, h)
+    return plan.grab()
+
+class CaptureBackend(abc.ABC):
+    """화면 캡처 백엔드 인터페이스
+
+    grab()은 캡처 계획(CapturePlan)의 영역을 BGR 배열로 반환합니다.
+    캡처 계획은 호출자가 선택 영역마다 한 번 만들고 화면 구성이 바뀌면 다시 만듭니다.
+    """
+    name = "base"
+
+    @abc.abstractmethod
+    def grab(self, plan):
+        """캡처 계획 영역 캡처 → (h, w, 3) BGR 배열"""
+
+    def invalidate(self):
+        """화면 구성 변경 시 캐시된 상태 폐기"""
+        pass
+
+    def close(self):
+        pass
+
+class QtCaptureBackend(CaptureBackend):
+    """QScreen.grabWindow 기반 캡처 (모든 플랫폼, GUI 스레드 전용)"""
+    name = "qt"
+
+    def grab(self, plan):
+        return qpixmap_to_cv(plan.grab())
 
 class SelectionOverlay(QWidget):
     """영역 선택 오버레이"""
@@ -1157,10 +1355,19 @@ class SelectionOverlay(QWidget):
             painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
 
 class CaptureAreaIndicator(QWidget):
-    """선택된 영역을 화면에 계속 표시하는 투명 위젯"""
+    """선택된 영역을 화면에 계속 표시하는 투명 위젯
+
+    테두리는 선택 영역 바깥쪽에 그리고 안쪽은 마스크로 제외하므로,
+    캡처 시 인디케이터를 숨기지 않아도 캡처 픽셀에 섞이지 않습니다.
+    """
+    BORDER = 4  # 영역 바깥쪽 테두리 두께 (px)
+
     def __init__(self, x, y, w, h, parent=None):
         super().__init__(parent)
-        self.setGeometry(x, y, w, h)
+        b = self.BORDER
+        self.setGeometry(x - b, y - b, w + 2 * b, h + 2 * b)
+        outer = QRegion(0, 0, w + 2 * b, h + 2 * b)
+        self.setMask(outer.subtracted(QRegion(b, b, w, h)))
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Window | Qt.WindowType.WindowTransparentForInput)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)  # 마우스 이벤트를 통과시킴
@@ -1176,7 +1383,8 @@ class CaptureAreaIndicator(QWidget):
         pen = QPen(self.border_color, 3)
         pen.setStyle(Qt.PenStyle.DashLine)
         painter.setPen(pen)
-        painter.drawRect(0, 0, self.width() - 1, self.height() - 1)
+        # 3px 펜의 중심을 바깥 띠(BORDER) 안쪽에 두어 선택 영역을 침범하지 않음
+        painter.drawRect(1, 1, self.width() - 3, self.height() - 3)
 
 class ClickableLabel(QLabel):
     clicked = Signal()
@@ -1186,41 +1394,295 @@ class ClickableLabel(QLabel):
             self.clicked.emit()
         super().mousePressEvent(event)
 
-def enhance_score_image(img_bgr, use_basic=False, use_high=False):
-    """OpenCV DNN Super Resolution을 이용한 업스케일링 (모델 없으면 Bicubic+Sharpening)"""
+class SuperResModelPool:
+    """초해상도 모델 풀 (프로세스 전역)
+
+    DnnSuperResImpl은 동시에 두 스레드가 쓰기에 안전하지 않으므로, (알고리즘, 배율)별 유휴 인스턴스
+    목록에서 하나를 빌려 쓰고 돌려줍니다. 스레드가 바뀌어도 (실행마다 새 스레드 풀) 로드한 모델을
+    다시 쓰며, 동시에 필요한 만큼만 인스턴스가 늘어납니다.
+    메모리 상한을 넘거나 오래 사용하지 않은 모델은 해제합니다.
+    유휴 시간 초과 검사는 반납 시와, 유휴 모델이 남아 있는 동안 타이머로 수행합니다.
+    """
+    MODEL_FILES = {
+        ("edsr", 4): "EDSR_x4.pb",
+        ("lapsrn", 4): "LapSRN_x4.pb",
+    }
+    # 모델 파일 크기 대비 런타임 메모리 추정 배수 (가중치 + 네트워크 버퍼)
+    MEMORY_FACTOR = 4
+
+    def __init__(self, models_dir, memory_limit_mb=SR_MODEL_MEMORY_LIMIT_MB, idle_timeout=SR_MODEL_IDLE_TIMEOUT):
+        self.models_dir = models_dir
+        self.memory_limit = memory_limit_mb * 1024 * 1024
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._entries = []  # 로드한 인스턴스 정보 (key, sr, size, in_use, last_used)
+        self._stats = {}    # (algo, scale) -> 로드/추론 통계
+        self._sweep_timer = None  # 유휴 모델 해제 타이머 (유휴 모델이 있을 때만 예약)
+
+    def model_path(self, algo, scale):
+        filename = self.MODEL_FILES.get((algo, scale))
+        if not filename:
+            return None
+        path = os.path.join(self.models_dir, filename)
+        return path if os.path.exists(path) else None
+
+    def is_available(self, algo, scale):
+        return hasattr(cv2, 'dnn_superres') and self.model_path(algo, scale) is not None
+
+    def _stat(self, algo, scale):
+        return self._stats.setdefault((algo, scale), {
+            'loads': 0, 'load_time': 0.0, 'runs': 0, 'infer_time': 0.0, 'evictions': 0
+        })
+
+    def _memory_usage(self):
+        return sum(e['size'] for e in self._entries)
+
+    def _evict(self, reserve=0):
+        """유휴 모델 해제 (시간 초과 모델 우선, 이후 메모리 상한까지 LRU 순)"""
+        now = time.perf_counter()
+        idle = sorted((e for e in self._entries if not e['in_use']), key=lambda e: e['last_used'])
+        for entry in idle:
+            expired = now - entry['last_used'] > self.idle_timeout
+            over_limit = self._memory_usage() + reserve > self.memory_limit
+            if not expired and not over_limit:
+                continue
+            self._entries.remove(entry)
+            self._stat(*entry['key'])['evictions'] += 1
+
+    def _acquire(self, algo, scale):
+        key = (algo, scale)
+        with self._lock:
+            # 가장 최근에 반납된 유휴 인스턴스를 빌림
+            idle = [e for e in self._entries if e['key'] == key and not e['in_use']]
+            if idle:
+                entry = max(idle, key=lambda e: e['last_used'])
+                entry['in_use'] = True
+                return entry
+
+        path = self.model_path(algo, scale)
+        if path is None or not hasattr(cv2, 'dnn_superres'):
+            return None
+        size = os.path.getsize(path) * self.MEMORY_FACTOR
+
+        with self._lock:
+            self._evict(reserve=size)
+
+        # 모델 로드는 잠금 밖에서 수행 (다른 스레드의 추론을 막지 않도록)
+        t0 = time.perf_counter()
+        sr = cv2.dnn_superres.DnnSuperResImpl_create()
+        sr.readModel(path)
+        sr.setModel(algo, scale)
+        elapsed = time.perf_counter() - t0
+
+        entry = {'key': key, 'sr': sr, 'size': size, 'in_use': True, 'last_used': time.perf_counter()}
+        with self._lock:
+            stat = self._stat(algo, scale)
+            stat['loads'] += 1
+            stat['load_time'] += elapsed
+            self._entries.append(entry)
+        return entry
+
+    def _release(self, entry):
+        with self._lock:
+            entry['in_use'] = False
+            entry['last_used'] = time.perf_counter()
+            self._evict()
+            self._schedule_sweep()
+
+    def _schedule_sweep(self):
+        """가장 오래된 유휴 모델이 만료될 때 다시 검사하도록 타이머 예약 (잠금 안에서 호출)"""
+        if self._sweep_timer is not None:
+            return
+        idle = [e['last_used'] for e in self._entries if not e['in_use']]
+        if not idle:
+            return
+        delay = max(0.0, min(idle) + self.idle_timeout - time.perf_counter()) + 1.0
+        self._sweep_timer = threading.Timer(delay, self._sweep)
+        self._sweep_timer.daemon = True
+        self._sweep_timer.start()
+
+    def _sweep(self):
+        with self._lock:
+            self._sweep_timer = None
+            self._evict()
+            self._schedule_sweep()
+
+    def upsample(self, img_bgr, algo, scale):
+        """빌린 모델 인스턴스로 업스케일 (모델이 없으면 None)"""
+        entry = self._acquire(algo, scale)
+        if entry is None:
+            return None
+        try:
+            t0 = time.perf_counter()
+            result = entry['sr'].upsample(img_bgr)
+            elapsed = time.perf_counter() - t0
+        finally:
+            self._release(entry)
+        with self._lock:
+            stat = self._stat(algo, scale)
+            stat['runs'] += 1
+            stat['infer_time'] += elapsed
+        return result
+
+    def get_stats(self):
+        """모델별 로드/추론 횟수와 누적 시간(초) 반환"""
+        with self._lock:
+            stats = {k: dict(v, instances=0) for k, v in self._stats.items()}
+            for entry in self._entries:
+                stats[entry['key']]['instances'] += 1
+            return stats
+
+    def log_stats(self):
+        """모델별 로드/추론 시간을 콘솔에 기록"""
+        for (algo, scale), stat in sorted(self.get_stats().items()):
+            avg_ms = stat['infer_time'] / stat['runs'] * 1000 if stat['runs'] else 0.0
+            print(f"SR model {algo} x{scale}: {stat['loads']} load(s) in {stat['load_time']:.2f}s, "
+                  f"{stat['runs']} run(s) avg {avg_ms:.0f}ms, {stat['instances']} loaded, "
+                  f"{stat['evictions']} evicted")
+
+    def clear(self):
+        """사용 중이 아닌 모든 모델 인스턴스 해제"""
+        with self._lock:
+            self._entries = [e for e in self._entries if e['in_use']]
+            if self._sweep_timer is not None:
+                self._sweep_timer.cancel()
+                self._sweep_timer = None
+
+SR_MODEL_POOL = SuperResModelPool(os.path.join(BASE_DIR, "models"))
+
+# 입력 픽셀당 추론 메모리 추정치 (x4 업스케일 시 중간 특징맵 포함, byte)
+SR_BYTES_PER_INPUT_PIXEL = {"edsr": 8192, "lapsrn": 4096}
+
+class MemoryBudget:
+    """여러 스레드가 동시에 실행하는 작업의 추정 메모리 합을 상한 이하로 유지 (넘으면 반납될 때까지 대기)"""
+
+    def __init__(self, limit_mb):
+        self.limit = limit_mb * 1024 * 1024
+        self.used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, nbytes):
+        """nbytes를 예약하고 실제 예약한 양을 반환 (상한보다 큰 작업은 혼자 실행되도록 상한만큼 예약)"""
+        nbytes = min(nbytes, self.limit)
+        with self._cond:
+            self._cond.wait_for(lambda: self.used + nbytes <= self.limit)
+            self.used += nbytes
+        return nbytes
+
+    def release(self, nbytes):
+        with self._cond:
+            self.used -= nbytes
+            self._cond.notify_all()
+
+SR_MEMORY_BUDGET = MemoryBudget(SR_TILE_MEMORY_BUDGET_MB)
+
+def upsample_tiled(img, upsample_fn, scale, memory_budget=SR_MEMORY_BUDGET, concurrency=1,
+                   overlap=SR_TILE_OVERLAP, bytes_per_pixel=8192, should_stop=None):
+    """겹치는 타일 단위 업스케일 (메모리 예산 내에서 처리, 경계는 선형 블렌딩)
+
+    memory_budget은 모든 호출이 공유하는 상한이며, 추론마다 추정 메모리를 예약하므로
+    동시에 실행되는 추론의 합이 상한을 넘지 않습니다. 타일은 concurrency개가 함께 들어가는 크기로 자릅니다.
+    upsample_fn(tile)은 업스케일된 타일을 반환해야 하며, None이면 전체 결과도 None입니다.
+    should_stop()이 True를 반환하면 타일 단위로 중단하고 None을 반환합니다.
+    """
+    h, w = img.shape[:2]
+    share = memory_budget.limit / max(1, concurrency)
+
+    def run(part):
+        reserved = memory_budget.acquire(part.shape[0] * part.shape[1] * bytes_per_pixel)
+        try:
+            return upsample_fn(part)
+        finally:
+            memory_budget.release(reserved)
+
+    # 예산 몫 안에 들어오면 타일링 없이 한 번에 처리
+    if h * w * bytes_per_pixel <= share:
+        return run(img)
+
+    tile = int((share / bytes_per_pixel) ** 0.5)
+    overlap = max(0, min(overlap, tile // 4))
+    step = max(tile - overlap, 1)
+
+    def starts(length):
+        if length <= tile:
+            return [0]
+        pos = list(range(0, length - tile, step))
+        pos.append(length - tile)
+        return pos
+
+    out = None
+    ys, xs = starts(h), starts(w)
+    for ty_idx, y0 in enumerate(ys):
+        for tx_idx, x0 in enumerate(xs):
+            if should_stop and should_stop():
+                return None
+            y1, x1 = min(y0 + tile, h), min(x0 + tile, w)
+            res = run(img[y0:y1, x0:x1])
+            if res is None:
+                return None
+            if out is None:
+                out = np.zeros((h * scale, w * scale) + res.shape[2:], dtype=res.dtype)
+
+            oy, ox = y0 * scale, x0 * scale
+            th, tw = res.shape[:2]
+            dst = out[oy:oy + th, ox:ox + tw]
+
+            # 이미 채워진 이웃(위/왼쪽)과 겹치는 구간만 0→1 램프로 블렌딩
+            left_ov = (xs[tx_idx - 1] + tile - x0) * scale if tx_idx > 0 else 0
+            top_ov = (ys[ty_idx - 1] + tile - y0) * scale if ty_idx > 0 else 0
+            if left_ov <= 0 and top_ov <= 0:
+                dst[:] = res
+                continue
+
+            wx = np.ones(tw, dtype=np.float32)
+            if left_ov > 0:
+                wx[:left_ov] = np.linspace(0.0, 1.0, left_ov, endpoint=False, dtype=np.float32)
+            wy = np.ones(th, dtype=np.float32)
+            if top_ov > 0:
+                wy[:top_ov] = np.linspace(0.0, 1.0, top_ov, endpoint=False, dtype=np.float32)
+            weight = np.outer(wy, wx)
+            if res.ndim == 3:
+                weight = weight[:, :, None]
+            blended = dst.astype(np.float32) * (1.0 - weight) + res.astype(np.float32) * weight
+            dst[:] = np.clip(np.rint(blended), 0, 255).astype(res.dtype)
+
+    return out
+
+def enhance_score_image(img_bgr, use_basic=False, use_high=False, should_stop=None, concurrency=1):
+    """OpenCV DNN Super Resolution을 이용한 업스케일링 (모델 없으면 Bicubic+Sharpening)
+
+    concurrency: 함께 실행되는 변환 수 (타일 크기를 메모리 예산의 몫에 맞춤)
+    한 장씩 변환하는 호출(미리보기, 크게 보기, PDF 내보내기)은 1로 예산 전체를 한 변환에 씁니다.
+    """
     if not use_basic and not use_high:
         return img_bgr
 
-    # 모델 파일이 위치할 경로 (models 폴더)
-    models_dir = os.path.join(BASE_DIR, "models")
-    
     # 고화질 모드(EDSR)가 체크되어 있으면 EDSR 우선 사용
     if use_high:
-        model_path = os.path.join(models_dir, "EDSR_x4.pb")
         algo = "edsr"
     # 기본 모드만 체크되어 있으면 LapSRN 사용
     elif use_basic:
-        model_path = os.path.join(models_dir, "LapSRN_x4.pb")
         algo = "lapsrn"
     else:
         return img_bgr
-    
-    model_info = None
-    
-    if os.path.exists(model_path):
-        model_info = (model_path, algo, 4)
 
     result_img = None
 
-    if model_info and hasattr(cv2, 'dnn_superres'):
-        try:
-            path, algo, scale = model_info
-            sr = cv2.dnn_superres.DnnSuperResImpl_create()
-            sr.readModel(path)
-            sr.setModel(algo, scale)
-            result_img = sr.upsample(img_bgr)
-        except Exception as e:
-            print(f"DNN Upscaling error: {e}")
+    try:
+        # 모델 풀에서 캐시된 네트워크 사용 (매 호출마다 모델을 다시 읽지 않음)
+        # 큰 이미지는 메모리 예산에 맞춰 타일 단위로 처리
+        if SR_MODEL_POOL.is_available(algo, 4):
+            result_img = upsample_tiled(
+                img_bgr, lambda tile: SR_MODEL_POOL.upsample(tile, algo, 4), 4,
+                concurrency=concurrency, bytes_per_pixel=SR_BYTES_PER_INPUT_PIXEL.get(algo, 8192),
+                should_stop=should_stop
+            )
+    except Exception as e:
+        print(f"DNN Upscaling error: {e}")
+
+    # 취소된 경우 Fallback 없이 원본 반환
+    if should_stop and should_stop():
+        return img_bgr
 
     # 모델 적용에 실패했거나 모델이 없는 경우 (기본 모드일 때만 Fallback)
     if result_img is None and use_basic and not use_high:
@@ -1259,51 +1721,98 @@ def apply_natural_grayscale(img_bgr):
     
     return cv2.cvtColor(soft_binary, cv2.COLOR_GRAY2BGR)
 
+# --- Qt / NumPy / PIL 이미지 변환 ---
+# 32비트 QImage는 리틀 엔디언에서 메모리상 B, G, R, A 순서로 저장됨
+QIMAGE_BGRA_FORMATS = (
+    QImage.Format.Format_RGB32,
+    QImage.Format.Format_ARGB32,
+    QImage.Format.Format_ARGB32_Premultiplied,
+)
+
+class QtImageArray(np.ndarray):
+    """QImage 버퍼를 복사 없이 참조하는 배열 (원본 QImage 수명 유지)"""
+    def __array_finalize__(self, obj):
+        self._owner = getattr(obj, '_owner', None)
+
+def qimage_to_ndarray(qimg):
+    """QImage를 복사 없이 NumPy 배열(view)로 변환
+
+    32비트 포맷은 (h, w, 4) BGRA, BGR888/RGB888은 (h, w, 3), Grayscale8은 (h, w).
+    행 패딩은 strides로 처리하며, 반환된 배열(및 그 슬라이스)이 살아있는 동안 QImage도 유지됩니다.
+    """
+    fmt = qimg.format()
+    if fmt in QIMAGE_BGRA_FORMATS and sys.byteorder == 'little':
+        channels = 4
+    elif fmt in (QImage.Format.Format_BGR888, QImage.Format.Format_RGB888):
+        channels = 3
+    elif fmt == QImage.Format.Format_Grayscale8:
+        channels = 1
+    else:
+        return None
+
+    h, w = qimg.height(), qimg.width()
+    bpl = qimg.bytesPerLine()
+    buf = qimg.constBits()
+    if channels == 1:
+        shape, strides = (h, w), (bpl, 1)
+    else:
+        shape, strides = (h, w, channels), (bpl, channels, 1)
+    arr = np.ndarray(shape, dtype=np.uint8, buffer=buf, strides=strides).view(QtImageArray)
+    arr._owner = qimg
+    return arr
+
+def cv2_to_qimage(img_cv):
+    """OpenCV 이미지를 복사 없이 감싸는 QImage 생성 (img_cv보다 오래 사용하면 안 됨)"""
+    if not img_cv.flags['C_CONTIGUOUS']:
+        img_cv = np.ascontiguousarray(img_cv)
+    h, w = img_cv.shape[:2]
+    if img_cv.ndim == 2:
+        fmt = QImage.Format.Format_Grayscale8
+    elif img_cv.shape[2] == 4:
+        fmt = QImage.Format.Format_ARGB32
+    else:
+        fmt = QImage.Format.Format_BGR888
+    qimg = QImage(img_cv.data, w, h, img_cv.strides[0], fmt)
+    return qimg, img_cv
+
 def cv2_to_qpixmap(img_cv):
-    """OpenCV 이미지를 QPixmap으로 변환"""
+    """OpenCV 이미지를 QPixmap으로 변환 (BGR888로 직접 감싸서 색 변환 복사 생략)"""
     if img_cv is None:
         return QPixmap()
-    # 메모리 연속성 보장
-    if not img_cv.flags['C_CONTIGUOUS']:
-        img_cv = np.ascontiguousarray(img_cv)
-    
-    rgb = cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
-    bytes_per_line = ch * w
-    qimg = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+    qimg, _buffer = cv2_to_qimage(img_cv)
+    # fromImage가 픽셀을 복사하므로 이후 _buffer가 해제되어도 안전
     return QPixmap.fromImage(qimg)
 
 def qpixmap_to_cv(pixmap):
-    """QPixmap을 OpenCV 이미지(BGR)로 변환"""
+    """QPixmap을 OpenCV 이미지(BGR)로 변환 (QImage 버퍼에서 BGR로 한 번만 복사)"""
     if pixmap.isNull():
         return None
-    img = pixmap.toImage().convertToFormat(QImage.Format.Format_RGB888)
-    w, h = img.width(), img.height()
-    ptr = img.constBits()
-    arr = np.array(ptr).reshape(h, img.bytesPerLine())
-    # 패딩 제거 및 BGR 변환
-    arr = arr[:, :w * 3].reshape(h, w, 3)
-    return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
-
-def calculate_ssim(img1, img2):
-    """scikit-image 제거를 위한 OpenCV 기반 SSIM 계산 함수"""
-    if img1.shape != img2.shape:
-        return 0.0
+    img = pixmap.toImage()
+    view = qimage_to_ndarray(img)
+    if view is not None and view.ndim == 3 and view.shape[2] == 4:
+        return cv2.cvtColor(view, cv2.COLOR_BGRA2BGR)
+
+    img = img.convertToFormat(QImage.Format.Format_BGR888)
+    return np.array(qimage_to_ndarray(img), dtype=np.uint8, copy=True)
+
+def cv2_to_pil(img_cv):
+    """OpenCV(BGR) 이미지를 PIL RGB 이미지로 변환 (PIL 디코더가 BGR→RGB 변환과 복사를 한 번에 처리)"""
+    if img_cv.ndim == 2:
+        return Image.fromarray(img_cv).convert("RGB")
+    if not img_cv.flags['C_CONTIGUOUS']:
+        img_cv = np.ascontiguousarray(img_cv)
+    h, w = img_cv.shape[:2]
+    return Image.frombuffer("RGB", (w, h), img_cv, "raw", "BGR", img_cv.strides[0], 1)
 
+def calculate_ssim_map(img1, img2, k_size=11):
+    """픽셀별 SSIM 맵 계산 (float32)"""
     # SSIM 상수 (L=255 기준)
     C1 = 6.5025  # (0.01 * 255)^2
     C2 = 58.5225 # (0.03 * 255)^2
 
-    img1 = img1.astype(np.float64)
-    img2 = img2.astype(np.float64)
-
-    # 커널 크기 설정 (이미지가 작을 경우 대비)
-    k_size = 11
-    min_dim = min(img1.shape[0], img1.shape[1])
-    if min_dim < k_size:
-        k_size = min_dim
-        if k_size % 2 == 0: k_size -= 1
-        if k_size < 3: k_size = 3
+    # float32로 충분 (분산 계산 오차가 C2 상수보다 훨씬 작음)
+    img1 = img1.astype(np.float32)
+    img2 = img2.astype(np.float32)
 
     kernel = (k_size, k_size)
     sigma = 1.5
@@ -1324,8 +1833,171 @@ def calculate_ssim(img1, img2):
     t3 = mu1_sq + mu2_sq + C1
     t4 = sigma1_sq + sigma2_sq + C2
 
-    ssim_map = (t1 * t2) / (t3 * t4)
-    return ssim_map.mean()
+    return (t1 * t2) / (t3 * t4)
+
+def calculate_ssim(img1, img2):
+    """scikit-image 제거를 위한 OpenCV 기반 SSIM 계산 함수"""
+    if img1.shape != img2.shape:
+        return 0.0
+
+    # 커널 크기 설정 (이미지가 작을 경우 대비)
+    k_size = 11
+    min_dim = min(img1.shape[0], img1.shape[1])
+    if min_dim < k_size:
+        k_size = min_dim
+        if k_size % 2 == 0: k_size -= 1
+        if k_size < 3: k_size = 3
+
+    return float(calculate_ssim_map(img1, img2, k_size).mean())
+
+class FrameChangeDetector:
+    """페이지 넘김 감지용 블록 단위 변화 검출기
+
+    1단계: 최대 절대 차이(NORM_INF)로 동일 프레임을 조기 판정 (전체 비교보다 수십 배 빠름)
+    2단계: 격자 블록별 SSIM(float32)을 계산하되, 실제로 달라진 블록과 그 이웃만
+    블록 행(band) 단위로 병렬 계산합니다. (OpenCV 연산은 GIL을 해제)
+    SSIM 윈도우 안의 픽셀이 모두 같으면 그 위치의 SSIM은 정확히 1이므로,
+    계산하지 않은 블록은 1로 둬도 결과가 같습니다.
+    제외 영역(ignore_regions)은 기준 프레임 값으로 덮어써 변화에서 빠지며,
+    절반 이상 가려진 블록은 판정 비율 계산에서도 제외됩니다.
+    """
+    KERNEL_RADIUS = 5  # calculate_ssim의 11x11 가우시안 커널 반경
+
+    def __init__(self, block_size=CHANGE_GRID_BLOCK, workers=CHANGE_DETECT_WORKERS):
+        self.block_size = block_size
+        self.workers = workers
+        self.ignore_regions = []  # (x, y, w, h) 비율 좌표 (0.0 ~ 1.0)
+        self._executor = None
+        self._mask = None
+        self._mask_shape = None
+        self.reset()
+
+    def reset(self):
+        self.ref_gray = None
+        self.last_stage = None      # 'identical' | 'ssim' | 'shape'
+        self.change_map = None      # 블록별 SSIM (2차원 배열)
+        self.block_valid = None     # 제외 영역이 아닌 블록 여부
+        self.last_score = 1.0       # 유효 블록 전체의 평균 SSIM
+        self.changed_fraction = 0.0
+
+    def set_reference(self, gray):
+        self.ref_gray = gray
+
+    def set_ignore_regions(self, regions):
+        self.ignore_regions = list(regions)
+        self._mask = None
+        self._mask_shape = None
+
+    def _ignore_mask(self, shape, border=0):
+        """비율 좌표의 제외 영역을 현재 프레임 크기의 마스크로 변환 (크기별 캐시)
+
+        비율은 캡처 전체 기준이므로, 테두리를 border만큼 잘라낸 프레임에서는 그만큼 옮겨 맞춥니다.
+        """
+        if not self.ignore_regions:
+            return None
+        if self._mask_shape != (shape, border):
+            h, w = shape[:2]
+            full_h, full_w = h + 2 * border, w + 2 * border
+            mask = np.zeros((h, w), dtype=bool)
+            for fx, fy, fw, fh in self.ignore_regions:
+                x0, y0 = int(round(fx * full_w)) - border, int(round(fy * full_h)) - border
+                x1, y1 = int(round((fx + fw) * full_w)) - border, int(round((fy + fh) * full_h)) - border
+                mask[max(0, y0):min(h, y1), max(0, x0):min(w, x1)] = True
+            self._mask = mask
+            self._mask_shape = (shape, border)
+        return self._mask
+
+    def _block_sums(self, arr, rows, cols):
+        return np.add.reduceat(np.add.reduceat(arr, rows, axis=0), cols, axis=1)
+
+    def _band_ssim(self, ref, gray, rows, cols, bi, need_row):
+        """블록 한 행(band)에서 필요한 열 구간의 블록별 평균 SSIM 계산"""
+        h, w = gray.shape[:2]
+        bs = self.block_size
+        r = self.KERNEL_RADIUS
+        idx = np.flatnonzero(need_row)
+        c_first, c_last = int(idx[0]), int(idx[-1])
+
+        y0, y1 = int(rows[bi]), min(int(rows[bi]) + bs, h)
+        x0, x1 = int(cols[c_first]), min(int(cols[c_last]) + bs, w)
+        # 블러 결과가 전체 이미지와 같도록 커널 반경만큼 문맥을 더 잘라옴
+        cy0, cy1 = max(0, y0 - r), min(h, y1 + r)
+        cx0, cx1 = max(0, x0 - r), min(w, x1 + r)
+
+        ssim_map = calculate_ssim_map(ref[cy0:cy1, cx0:cx1], gray[cy0:cy1, cx0:cx1], 2 * r + 1)
+        inner = ssim_map[y0 - cy0:y1 - cy0, x0 - cx0:x1 - cx0]
+
+        starts = cols[c_first:c_last + 1] - x0
+        widths = np.diff(np.append(starts, x1 - x0))
+        sums = np.add.reduceat(inner.sum(axis=0, dtype=np.float64), starts)
+        return bi, c_first, c_last + 1, sums / (widths * (y1 - y0))
+
+    def compute_change_map(self, gray, border=0):
+        """블록별 SSIM 맵 계산 (기준 프레임이 없거나 크기가 다르면 None, border: 잘라낸 테두리 폭)"""
+        ref = self.ref_gray
+        if ref is None or gray.shape != ref.shape:
+            self.last_stage = 'shape'
+            self.change_map = None
+            return None
+
+        h, w = gray.shape[:2]
+        rows = np.arange(0, h, self.block_size)
+        cols = np.arange(0, w, self.block_size)
+        areas = np.outer(np.diff(np.append(rows, h)), np.diff(np.append(cols, w)))
+
+        mask = self._ignore_mask(gray.shape, border)
+        if mask is not None:
+            gray = gray.copy()
+            np.copyto(gray, ref, where=mask)
+            coverage = self._block_sums(mask.astype(np.float32), rows, cols) / areas
+            valid = coverage < 0.5
+        else:
+            valid = np.ones(areas.shape, dtype=bool)
+
+        change_map = np.ones(areas.shape, dtype=np.float32)
+        r = self.KERNEL_RADIUS
+
+        if cv2.norm(ref, gray, cv2.NORM_INF) == 0:
+            self.last_stage = 'identical'
+        elif min(h, w) < 2 * r + 1:
+            # 이미지가 커널보다 작으면 calculate_ssim의 커널 축소 규칙을 그대로 따름
+            self.last_stage = 'ssim'
+            change_map[:] = calculate_ssim(ref, gray)
+        else:
+            self.last_stage = 'ssim'
+            diff = cv2.absdiff(ref, gray)
+            block_diff = np.maximum.reduceat(np.maximum.reduceat(diff, rows, axis=0), cols, axis=1) > 0
+            # SSIM 윈도우가 이웃 블록까지 걸치므로 한 칸 팽창
+            need = cv2.dilate(block_diff.astype(np.uint8), np.ones((3, 3), np.uint8)) > 0
+            bands = [bi for bi in range(len(rows)) if need[bi].any()]
+
+            if len(bands) > 1 and self.workers > 1:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers)
+                results = self._executor.map(lambda bi: self._band_ssim(ref, gray, rows, cols, bi, need[bi]), bands)
+            else:
+                results = (self._band_ssim(ref, gray, rows, cols, bi, need[bi]) for bi in bands)
+            for bi, c0, c1, values in results:
+                change_map[bi, c0:c1] = values
+
+        self.change_map = change_map
+        self.block_valid = valid
+        valid_area = areas[valid].sum()
+        self.last_score = float((change_map * areas)[valid].sum() / valid_area) if valid_area else 1.0
+        return change_map
+
+    def is_changed(self, gray, sensitivity, min_fraction=CHANGE_BLOCK_FRACTION, border=0):
+        """SSIM이 민감도보다 낮은 블록 비율이 min_fraction 이상이면 변화로 판정"""
+        change_map = self.compute_change_map(gray, border)
+        if change_map is None:
+            return True
+        valid = self.block_valid
+        if not valid.any():
+            self.changed_fraction = 0.0
+            return False
+        changed = (change_map < sensitivity) & valid
+        self.changed_fraction = float(changed.sum()) / float(valid.sum())
+        return self.changed_fraction >= min_fraction
 
 def get_pil_font(path, size):
     """PIL 폰트 로드 헬퍼"""
@@ -1342,12 +2014,21 @@ def get_text_size(draw, text, font):
     else:
         return draw.textsize(text, font=font)
 
-def calculate_best_cut_point(img, min_x, max_x):
-    """이미지에서 최적의 자르기 위치(세로선)를 찾습니다."""
+def calculate_best_cut_point(img, min_x, max_x, axis='horizontal'):
+    """이미지에서 최적의 자르기 위치를 찾습니다.
+
+    가로 스크롤은 세로선(마디선) 위치를, 세로 스크롤(axis='vertical')은 단 사이 공백 행을 찾으며
+    min_x, max_x는 스크롤 방향 좌표(세로 스크롤에서는 행)입니다.
+    """
     h, w = img.shape[:2]
-    if min_x >= max_x or max_x > w:
+    if min_x >= max_x or max_x > (h if axis == 'vertical' else w):
         return None
-        
+
+    if axis == 'vertical':
+        # 오선(가로선)을 가로지르지 않도록 선 검출 없이 공백만 찾음 (행을 열로 바꿔 아래 5단계 사용)
+        gray = cv2.cvtColor(np.ascontiguousarray(img[min_x:max_x]), cv2.COLOR_BGR2GRAY).T
+        return _blank_cut_point(gray, min_x)
+
     roi = img[:, min_x:max_x]
     
     # 1. 전처리: 그레이스케일 -> 이진화
@@ -1379,6 +2060,10 @@ def calculate_best_cut_point(img, min_x, max_x):
         return best_x + 5
         
     # 5. 공백 찾기
+    return _blank_cut_point(gray, min_x)
+
+def _blank_cut_point(gray, min_x):
+    """가장 비어 있는(밝은) 열 위치 (gray는 min_x부터 시작하는 구간)"""
     inverted_gray = 255 - gray
     col_sums_gray = np.sum(inverted_gray, axis=0)
     
@@ -1392,18 +2077,34 @@ def calculate_best_cut_point(img, min_x, max_x):
     return min_x + np.argmin(col_sums_gray)
 
 class SlicerCanvas(QWidget):
+    """스크롤 캡처 자르기 캔버스
+
+    긴 이미지 전체를 QPixmap으로 만들지 않고, 보이는 영역의 열(세로 스크롤은 행) 타일만 변환해 그립니다.
+    image는 ndarray 또는 StripView (image[:, a:b], image[a:b] 슬라이스 지원)이고,
+    자르기 위치는 스크롤 방향 좌표 (가로 스크롤은 x, 세로 스크롤은 y)입니다.
+    """
     point_added = Signal(int)
     point_removed = Signal(int)
+    TILE_WIDTH = 512
+    MAX_TILES = 32
 
-    def __init__(self, pixmap, parent=None):
+    def __init__(self, image, parent=None, axis='horizontal'):
         super().__init__(parent)
-        self.pixmap = pixmap
+        self.image = image
+        self.vertical = axis == 'vertical'
+        self.image_size = QSize(image.shape[1], image.shape[0])
+        self.length = image.shape[0] if self.vertical else image.shape[1]
+        self.tiles = collections.OrderedDict()  # 타일 번호 -> QPixmap (LRU)
         self.scale_factor = 1.0
         self.cut_points = []
-        self.setFixedSize(pixmap.size())
+        self.setFixedSize(self.image_size)
         self.setCursor(Qt.CursorShape.CrossCursor)
         self.setMouseTracking(True)
-        self.hover_x = -1
+        self.hover_pos = -1
+
+    def _along(self, pos):
+        """위젯 좌표의 스크롤 방향 성분"""
+        return pos.y() if self.vertical else pos.x()
 
     def set_cut_points(self, points):
         self.cut_points = sorted(list(set(points)))
@@ -1417,18 +2118,18 @@ class SlicerCanvas(QWidget):
         
         self.scale_factor = max(0.1, min(self.scale_factor, 5.0))
         
-        new_size = self.pixmap.size() * self.scale_factor
+        new_size = self.image_size * self.scale_factor
         self.setFixedSize(new_size)
         self.update()
 
     def mouseMoveEvent(self, event):
-        self.hover_x = int(event.position().x() / self.scale_factor)
+        self.hover_pos = int(self._along(event.position()) / self.scale_factor)
         self.update()
 
     def mousePressEvent(self, event):
-        sx = event.position().x()
+        sx = self._along(event.position())
         x = int(sx / self.scale_factor)
-        x = max(0, min(x, self.pixmap.width()))
+        x = max(0, min(x, self.length))
         
         if event.button() == Qt.MouseButton.LeftButton:
             self.cut_points.append(x)
@@ -1449,29 +2150,58 @@ class SlicerCanvas(QWidget):
                 self.point_removed.emit(closest)
                 self.update()
 
+    def _tile(self, index):
+        pixmap = self.tiles.get(index)
+        if pixmap is None:
+            x0 = index * self.TILE_WIDTH
+            tile = self.image[x0:x0 + self.TILE_WIDTH] if self.vertical else self.image[:, x0:x0 + self.TILE_WIDTH]
+            pixmap = cv2_to_qpixmap(np.ascontiguousarray(tile))
+            self.tiles[index] = pixmap
+            if len(self.tiles) > self.MAX_TILES:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(index)
+        return pixmap
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.scale(self.scale_factor, self.scale_factor)
-        painter.drawPixmap(0, 0, self.pixmap)
+        # 보이는 영역에 걸친 타일만 그림
+        visible = event.rect()
+        start, end = (visible.top(), visible.bottom()) if self.vertical else (visible.left(), visible.right())
+        first = max(0, int(start / self.scale_factor) // self.TILE_WIDTH)
+        last = min((self.length - 1) // self.TILE_WIDTH, int(end / self.scale_factor) // self.TILE_WIDTH)
+        for index in range(first, last + 1):
+            if self.vertical:
+                painter.drawPixmap(0, index * self.TILE_WIDTH, self._tile(index))
+            else:
+                painter.drawPixmap(index * self.TILE_WIDTH, 0, self._tile(index))
         
         pen = QPen(QColor(255, 0, 0), 2.0 / self.scale_factor)
         painter.setPen(pen)
-        h = self.pixmap.height()
         for x in self.cut_points:
-            painter.drawLine(x, 0, x, h)
+            self._draw_cut_line(painter, x)
             
-        if 0 <= self.hover_x < self.pixmap.width():
+        if 0 <= self.hover_pos < self.length:
             pen_hover = QPen(QColor(0, 120, 212, 150), 1.0 / self.scale_factor, Qt.PenStyle.DashLine)
             painter.setPen(pen_hover)
-            painter.drawLine(self.hover_x, 0, self.hover_x, h)
+            self._draw_cut_line(painter, self.hover_pos)
+
+    def _draw_cut_line(self, painter, pos):
+        if self.vertical:
+            painter.drawLine(0, pos, self.image_size.width(), pos)
+        else:
+            painter.drawLine(pos, 0, pos, self.image_size.height())
 
 class ScrollSlicerDialog(QDialog):
-    def __init__(self, image, target_width, parent=None, initial_points=None):
+    def __init__(self, image, target_width, parent=None, initial_points=None, axis='horizontal'):
+        """target_width: 조각 하나의 목표 길이 (스크롤 방향, 세로 스크롤은 캡처 영역 높이)"""
         super().__init__(parent)
         self.setWindowTitle("스크롤 캡처 자르기 편집")
         self.resize(1200, 800)
         self.image = image
         self.target_width = target_width
+        self.axis = axis
         
         layout = QVBoxLayout(self)
         
@@ -1484,11 +2214,13 @@ class ScrollSlicerDialog(QDialog):
         
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
-        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        if axis == 'vertical':
+            self.scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        else:
+            self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.scroll.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self.pixmap = cv2_to_qpixmap(image)
-        self.canvas = SlicerCanvas(self.pixmap)
+        self.canvas = SlicerCanvas(image, axis=axis)
         self.scroll.setWidget(self.canvas)
         layout.addWidget(self.scroll)
         
@@ -1556,9 +2288,8 @@ class ScrollSlicerDialog(QDialog):
                 self.canvas.perform_zoom(event.angleDelta().y())
                 return True
             else:
-                self.scroll.horizontalScrollBar().setValue(
-                    self.scroll.horizontalScrollBar().value() - event.angleDelta().y()
-                )
+                bar = self.scroll.verticalScrollBar() if self.axis == 'vertical' else self.scroll.horizontalScrollBar()
+                bar.setValue(bar.value() - event.angleDelta().y())
                 return True
         return super().eventFilter(source, event)
 
@@ -1568,7 +2299,7 @@ class ScrollSlicerDialog(QDialog):
 
     def run_auto_detect(self):
         points = []
-        total_width = self.image.shape[1]
+        total_width = self.canvas.length
         current_x = 0
         
         while current_x < total_width:
@@ -1578,7 +2309,7 @@ class ScrollSlicerDialog(QDialog):
             search_min = int(self.target_width * 0.8)
             search_max = int(self.target_width * 1.2)
             
-            cut_x = calculate_best_cut_point(self.image, current_x + search_min, current_x + search_max)
+            cut_x = calculate_best_cut_point(self.image, current_x + search_min, current_x + search_max, self.axis)
             
             if cut_x:
                 points.append(cut_x)
@@ -1594,7 +2325,7 @@ class ScrollSlicerDialog(QDialog):
         points = sorted(list(set(self.canvas.cut_points)))
         count = 0
         start_x = 0
-        h, w = self.image.shape[:2]
+        w = self.canvas.length
         
         calc_points = points.copy()
         if not calc_points or calc_points[-1] < w:
@@ -1613,7 +2344,7 @@ class ScrollSlicerDialog(QDialog):
         points = sorted(list(set(self.canvas.cut_points)))
         images = []
         start_x = 0
-        h, w = self.image.shape[:2]
+        w = self.canvas.length
         
         if not points or points[-1] < w:
             points.append(w)
@@ -1621,12 +2352,150 @@ class ScrollSlicerDialog(QDialog):
         for x in points:
             if x > start_x:
                 x = min(x, w)
-                img_chunk = self.image[:, start_x:x]
-                if img_chunk.shape[1] > 50:
+                if self.axis == 'vertical':
+                    img_chunk = self.image[start_x:x]
+                else:
+                    img_chunk = self.image[:, start_x:x]
+                if x - start_x > 50:
                     images.append(img_chunk)
                 start_x = x
         return images
 
+class IgnoreRegionCanvas(QWidget):
+    """변화 감지 제외 영역을 드래그로 그리는 캔버스"""
+    regions_changed = Signal()
+
+    def __init__(self, pixmap, regions=None, change_info=None, parent=None):
+        super().__init__(parent)
+        self.pixmap = pixmap
+        self.regions = list(regions or [])  # (x, y, w, h) 비율 좌표
+        self.change_info = change_info
+        self.start_pos = None
+        self.current_pos = None
+        self.setCursor(Qt.CursorShape.CrossCursor)
+
+        # 큰 영역은 화면에 맞게 축소해서 표시
+        size = pixmap.deviceIndependentSize().toSize()
+        scale = min(1.0, 900 / max(1, size.width()), 600 / max(1, size.height()))
+        self.setFixedSize(max(1, int(size.width() * scale)), max(1, int(size.height() * scale)))
+
+    def _to_ratio_rect(self, rect):
+        w, h = self.width(), self.height()
+        return (rect.x() / w, rect.y() / h, rect.width() / w, rect.height() / h)
+
+    def _to_widget_rect(self, region):
+        fx, fy, fw, fh = region
+        w, h = self.width(), self.height()
+        return QRectF(fx * w, fy * h, fw * w, fh * h)
+
+    def clear_regions(self):
+        self.regions = []
+        self.regions_changed.emit()
+        self.update()
+
+    def mousePressEvent(self, event):
+        pos = event.position().toPoint()
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.start_pos = pos
+            self.current_pos = pos
+        elif event.button() == Qt.MouseButton.RightButton:
+            # 클릭한 위치를 포함하는 영역 중 가장 나중에 추가된 것 삭제
+            for region in reversed(self.regions):
+                if self._to_widget_rect(region).contains(QPointF(pos)):
+                    self.regions.remove(region)
+                    self.regions_changed.emit()
+                    self.update()
+                    break
+
+    def mouseMoveEvent(self, event):
+        if self.start_pos is not None:
+            self.current_pos = event.position().toPoint()
+            self.update()
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.start_pos is not None:
+            rect = QRect(self.start_pos, self.current_pos).normalized().intersected(self.rect())
+            if rect.width() > 3 and rect.height() > 3:
+                self.regions.append(self._to_ratio_rect(rect))
+                self.regions_changed.emit()
+            self.start_pos = None
+            self.current_pos = None
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(self.rect(), self.pixmap)
+
+        # 최근 변화 맵: 민감도보다 SSIM이 낮은 블록을 주황색으로 표시
+        info = self.change_info
+        if info is not None:
+            change_map = info['map']
+            rows, cols = change_map.shape
+            bw, bh = self.width() / cols, self.height() / rows
+            changed = (change_map < info['sensitivity']) & info['valid']
+            for r, c in zip(*np.nonzero(changed)):
+                painter.fillRect(QRectF(c * bw, r * bh, bw, bh), QColor(255, 140, 0, 90))
+
+        painter.setPen(QPen(QColor(220, 53, 69), 2))
+        painter.setBrush(QColor(220, 53, 69, 70))
+        for region in self.regions:
+            painter.drawRect(self._to_widget_rect(region))
+
+        if self.start_pos is not None and self.current_pos is not None:
+            painter.setPen(QPen(QColor(0, 120, 212), 2, Qt.PenStyle.DashLine))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(QRect(self.start_pos, self.current_pos).normalized())
+
+class IgnoreRegionDialog(QDialog):
+    """페이지 넘김 감지에서 제외할 영역(타이머, 재생 커서 등) 편집"""
+    def __init__(self, pixmap, regions=None, change_info=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("변화 감지 제외 영역")
+
+        layout = QVBoxLayout(self)
+
+        lbl_info = QLabel("🖌️ 드래그하여 변화 감지에서 제외할 영역을 그리세요. (우클릭: 삭제)\n주황색 블록은 최근 프레임에서 변화가 감지된 곳입니다.")
+        lbl_info.setStyleSheet("font-size: 13px; font-weight: bold;")
+        layout.addWidget(lbl_info)
+
+        self.canvas = IgnoreRegionCanvas(pixmap, regions, change_info)
+        layout.addWidget(self.canvas, 0, Qt.AlignmentFlag.AlignCenter)
+
+        btn_layout = QHBoxLayout()
+
+        btn_clear = QPushButton("모두 지우기")
+        btn_clear.setMinimumHeight(36)
+        btn_clear.clicked.connect(self.canvas.clear_regions)
+
+        self.lbl_count = QLabel()
+        self.lbl_count.setStyleSheet("font-size: 13px; font-weight: bold; color: #0078d4; margin-left: 15px;")
+
+        btn_cancel = QPushButton("취소")
+        btn_cancel.setMinimumHeight(36)
+        btn_cancel.clicked.connect(self.reject)
+
+        btn_ok = QPushButton("적용")
+        btn_ok.setMinimumHeight(36)
+        btn_ok.clicked.connect(self.accept)
+
+        btn_layout.addWidget(btn_clear)
+        btn_layout.addWidget(self.lbl_count)
+        btn_layout.addStretch()
+        btn_layout.addWidget(btn_cancel)
+        btn_layout.addWidget(btn_ok)
+        layout.addLayout(btn_layout)
+
+        self.canvas.regions_changed.connect(self.update_count)
+        self.update_count()
+
+        apply_window_theme(self, parent)
+
+    def update_count(self):
+        self.lbl_count.setText(f"제외 영역: {len(self.canvas.regions)}개")
+
+    def get_regions(self):
+        return list(self.canvas.regions)
+
 class DraggableScrollArea(QScrollArea):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1651,7 +2520,7 @@ class DraggableScrollArea(QScrollArea):
             img = imread_unicode(image_path)
             if img is not None:
                 if use_basic or use_high:
-                    img = enhance_score_image(img, use_basic=use_basic, use_high=use_high)
+                    img = enhance_score_image(img, use_basic=use_basic, use_high=use_high, concurrency=1)
                 
                 if adaptive:
                     img = apply_natural_grayscale(img)
@@ -1662,7 +2531,7 @@ class DraggableScrollArea(QScrollArea):
             else:
                 self.original_pixmap = QPixmap()
         else:
-            self.original_pixmap = QPixmap(image_path)
+            self.original_pixmap = load_qpixmap(image_path)
             
         if self.original_pixmap.isNull():
             return
@@ -1783,42 +2652,72 @@ class ListItemDelegate(QStyledItemDelegate):
         painter.restore()
 
 class ImageEnhancerWorker(QObject):
+    """화질 개선 워커 (OpenCV가 GIL을 해제하므로 스레드 풀로 병렬 처리)"""
     progress = Signal(int)
     finished = Signal(dict)
     
-    def __init__(self, files, use_basic=False, use_high=False, cache_dir=None):
+    def __init__(self, files, use_basic=False, use_high=False, cache_dir=None, max_workers=None):
         super().__init__()
         self.files = files
         self.use_basic = use_basic
         self.use_high = use_high
         self.cache_dir = cache_dir
+        self.max_workers = max(1, max_workers or ENHANCE_MAX_WORKERS)
         self.is_running = True
 
+    def _process(self, path, cache_type):
+        """파일 하나를 변환 (취소 시 None 반환)"""
+        if not self.is_running: return None
+        img = imread_unicode(path)
+        if img is None: return None
+        res = enhance_score_image(img, use_basic=self.use_basic, use_high=self.use_high,
+                                  should_stop=lambda: not self.is_running, concurrency=self.max_workers)
+        if not self.is_running: return None
+        if self.cache_dir:
+            base_name = os.path.basename(path)
+            name, ext = os.path.splitext(base_name)
+            cached_filename = f"{name}_{cache_type}{ext}"
+            cached_path = os.path.join(self.cache_dir, cached_filename)
+            if imwrite_unicode(cached_path, res):
+                return cached_path
+            return None
+        return res
+
     def run(self):
         results = {}
         cache_type = 'hq' if self.use_high else 'basic'
+        # DNN 추론 하나가 OpenCV 스레드를 모두 쓰므로, 동시에 돌리는 작업 수만큼 추론당 스레드를 나눠
+        # 전체 스레드 수가 코어 수를 넘지 않게 함 (끝나면 원래 값으로 복원)
+        cv_threads = cv2.getNumThreads()
+        if self.max_workers > 1:
+            cv2.setNumThreads(max(1, (os.cpu_count() or 1) // self.max_workers))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
         try:
-            for i, path in enumerate(self.files):
-                if not self.is_running: break
-                try:
-                    img = imread_unicode(path)
-                    if img is not None:
-                        res = enhance_score_image(img, use_basic=self.use_basic, use_high=self.use_high)
-                        if self.cache_dir:
-                            base_name = os.path.basename(path)
-                            name, ext = os.path.splitext(base_name)
-                            cached_filename = f"{name}_{cache_type}{ext}"
-                            cached_path = os.path.join(self.cache_dir, cached_filename)
-                            if imwrite_unicode(cached_path, res):
-                                results[path] = cached_path
-                        else:
-                            results[path] = res
-                except Exception:
-                    pass
-                self.progress.emit(i + 1)
+            futures = {executor.submit(self._process, path, cache_type): path for path in self.files}
+            done_results = {}
+            pending = set(futures)
+            while pending and self.is_running:
+                # 짧은 주기로 깨어나 취소 여부 확인
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        res = future.result()
+                        if res is not None:
+                            done_results[futures[future]] = res
+                    except Exception:
+                        pass
+                if done:
+                    self.progress.emit(len(futures) - len(pending))
+            # 결과는 입력 파일 순서대로 전달
+            for path in self.files:
+                if path in done_results:
+                    results[path] = done_results[path]
         except Exception:
             pass
         finally:
+            # 대기 중인 작업은 취소하고, 진행 중인 작업은 결과를 버림
+            executor.shutdown(wait=False, cancel_futures=True)
+            cv2.setNumThreads(cv_threads)
             self.finished.emit(results)
 
     def stop(self):
@@ -2201,7 +3100,7 @@ class ScoreEditorWidget(QWidget):
                 item.widget().deleteLater()
 
     def show_large_image(self, path):
-        if os.path.exists(path):
+        if image_exists(path):
             do_invert = self.chk_invert.isChecked()
             invert_mode = getattr(self, 'invert_mode', 'both')
             invert_score = do_invert and (invert_mode in ["score", "both"])
@@ -2295,6 +3194,7 @@ class ScoreEditorWidget(QWidget):
 
     def on_enhancement_finished(self, results):
         if self.chk_high_quality.isChecked():
+            SR_MODEL_POOL.log_stats()
             self.hq_cache.update(results)
         elif self.chk_enhance.isChecked():
             self.basic_cache.update(results)
@@ -2532,7 +3432,7 @@ class ScoreEditorWidget(QWidget):
                 progress.setValue(i)
                 QApplication.processEvents()
 
-                if not os.path.exists(path):
+                if not image_exists(path):
                     continue
                 
                 img_cv = None
@@ -2542,7 +3442,7 @@ class ScoreEditorWidget(QWidget):
                     else:
                         raw_img = imread_unicode(path)
                         if raw_img is not None:
-                            img_cv = enhance_score_image(raw_img, use_basic=False, use_high=True)
+                            img_cv = enhance_score_image(raw_img, use_basic=False, use_high=True, concurrency=1)
                             cached_path = self._save_to_cache(img_cv, path, 'hq')
                             if cached_path:
                                 self.hq_cache[path] = cached_path
@@ -2552,7 +3452,7 @@ class ScoreEditorWidget(QWidget):
                     else:
                         raw_img = imread_unicode(path)
                         if raw_img is not None:
-                            img_cv = enhance_score_image(raw_img, use_basic=True, use_high=False)
+                            img_cv = enhance_score_image(raw_img, use_basic=True, use_high=False, concurrency=1)
                             cached_path = self._save_to_cache(img_cv, path, 'basic')
                             if cached_path:
                                 self.basic_cache[path] = cached_path
@@ -2640,49 +3540,910 @@ class ScoreEditorWidget(QWidget):
             progress.setValue(len(file_paths))
             progress.close()
 
+class FrameQueue:
+    """perform_capture와 CaptureWorker 사이의 크기 제한 프레임 큐 (스레드 안전)
+
+    큐가 가득 찼을 때의 정책:
+    - drop_oldest: 가장 오래된 프레임을 버리고 새 프레임 추가
+    - drop_newest: 새 프레임을 버림
+    - latest: 대기 중인 프레임을 모두 버리고 최신 프레임 하나만 유지
+    - block: 자리가 날 때까지 넣는 쪽이 대기 (버리면 안 되는 저장 단계용, GUI 스레드에서 사용 금지)
+    버린 프레임 수와 대기 시간을 집계하여 상태 표시에 사용합니다.
+    dropped는 큐에 들어왔다가 버려진 항목, rejected는 drop_newest로 아예 들어오지 못한 항목 수입니다.
+    """
+    POLICIES = {
+        "latest": "최신만 유지",
+        "drop_oldest": "오래된 것 버림",
+        "drop_newest": "새 것 버림",
+    }
+    BLOCK = "block"
+
+    def __init__(self, maxsize=FRAME_QUEUE_SIZE, policy=FRAME_QUEUE_POLICY):
+        self.maxsize = max(1, maxsize)
+        self.policy = policy if policy in self.POLICIES or policy == self.BLOCK else FRAME_QUEUE_POLICY
+        self._lock = threading.Condition()
+        self._frames = collections.deque()
+        self.reset()
+
+    def reset(self):
+        """대기 프레임과 집계 초기화"""
+        with self._lock:
+            self._frames.clear()
+            self.enqueued = 0
+            self.processed = 0
+            self.dropped = 0
+            self.rejected = 0
+            self.taken = 0
+            self.total_wait = 0.0  # 큐 대기 시간 합계 (초)
+            self.max_wait = 0.0
+
+    def set_policy(self, policy):
+        if policy in self.POLICIES:
+            with self._lock:
+                self.policy = policy
+
+    def put(self, frame):
+        """프레임(dict) 추가. 정책에 의해 버려지면 False 반환"""
+        frame['queued_at'] = time.perf_counter()
+        with self._lock:
+            if self.policy == self.BLOCK:
+                self._lock.wait_for(lambda: len(self._frames) < self.maxsize)
+            elif self.policy == "latest":
+                self.dropped += len(self._frames)
+                self._frames.clear()
+            elif len(self._frames) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.rejected += 1
+                    return False
+                self._frames.popleft()
+                self.dropped += 1
+            self._frames.append(frame)
+            self.enqueued += 1
+            return True
+
+    def put_nowait(self, frame):
+        """크기 제한과 정책을 무시하고 바로 추가 (GUI 스레드용, 이미 메모리에 있는 항목을 넘길 때)"""
+        frame['queued_at'] = time.perf_counter()
+        with self._lock:
+            self._frames.append(frame)
+            self.enqueued += 1
+
+    def get(self):
+        """가장 오래된 프레임을 꺼냄 (없으면 None)"""
+        with self._lock:
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._lock.notify()
+            wait_time = time.perf_counter() - frame['queued_at']
+            self.taken += 1
+            self.total_wait += wait_time
+            self.max_wait = max(self.max_wait, wait_time)
+            return frame
+
+    def task_done(self):
+        with self._lock:
+            self.processed += 1
+            self._lock.notify_all()
+
+    def join(self, timeout=None):
+        """넣은 항목이 모두 처리(또는 버려짐)될 때까지 대기. 시간 초과 시 False"""
+        with self._lock:
+            return self._lock.wait_for(lambda: self.enqueued - self.dropped - self.processed <= 0, timeout)
+
+    def clear(self):
+        """대기 중인 프레임을 버림 (버린 수에 포함)"""
+        with self._lock:
+            self.dropped += len(self._frames)
+            self._frames.clear()
+            self._lock.notify_all()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pending': len(self._frames),
+                'enqueued': self.enqueued,
+                'processed': self.processed,
+                'dropped': self.dropped,
+                'rejected': self.rejected,
+                'avg_wait_ms': self.total_wait * 1000.0 / self.taken if self.taken else 0.0,
+                'max_wait_ms': self.max_wait * 1000.0,
+            }
+
+class StageMetrics:
+    """캡처 파이프라인 단계별(캡처 → 분석 → 저장) 처리 시간 집계 (스레드 안전)"""
+    STAGES = ("grab", "analyze", "persist")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._data = {stage: [0, 0.0, 0.0] for stage in self.STAGES}  # 횟수, 합계, 최대 (초)
+            self._counters = collections.Counter()
+
+    def increment(self, name, amount=1):
+        """이벤트 횟수 집계 (예: 전체 폭 재탐색)"""
+        with self._lock:
+            self._counters[name] += amount
+
+    def counters(self):
+        with self._lock:
+            return dict(self._counters)
+
+    def record(self, stage, seconds):
+        with self._lock:
+            entry = self._data[stage]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def snapshot(self):
+        """단계별 {count, avg_ms, max_ms}"""
+        with self._lock:
+            return {stage: {'count': n, 'avg_ms': total * 1000.0 / n if n else 0.0, 'max_ms': peak * 1000.0}
+                    for stage, (n, total, peak) in self._data.items()}
+
+class CaptureScheduler:
+    """프레임 변화에 따라 캡처 주기를 조절하는 스케줄러
+
+    변화(페이지 전환 중, 스크롤 중)가 감지되면 최소 주기로 올리고,
+    화면이 멈춰 있으면 주기를 지수적으로 늘립니다.
+    프레임 처리 비용이 CPU 예산을 넘지 않도록 주기의 하한을 둡니다.
+    """
+    BACKOFF = 1.5
+    COST_SMOOTHING = 0.2
+
+    def __init__(self, base_ms=CAPTURE_INTERVAL_MS, min_ms=CAPTURE_INTERVAL_MIN_MS,
+                 max_ms=CAPTURE_INTERVAL_MAX_MS, cpu_budget=CAPTURE_CPU_BUDGET):
+        self.base_ms = base_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.cpu_budget = cpu_budget
+        self.reset()
+
+    def reset(self):
+        self.interval_ms = self.base_ms
+        self.avg_cost = 0.0  # 프레임당 처리 시간 이동 평균 (초)
+
+    @property
+    def current_rate(self):
+        """현재 초당 캡처 횟수"""
+        return 1000.0 / self.interval_ms
+
+    def update(self, active, cost):
+        """프레임 분석 결과(active: 변화 여부, cost: 처리 시간 초)로 다음 주기(ms) 계산"""
+        if self.avg_cost <= 0:
+            self.avg_cost = cost
+        else:
+            self.avg_cost += (cost - self.avg_cost) * self.COST_SMOOTHING
+
+        if active:
+            interval = self.min_ms
+        else:
+            interval = self.interval_ms * self.BACKOFF
+
+        # CPU 예산: 처리 시간이 주기의 cpu_budget 비율을 넘지 않도록 제한
+        floor = self.avg_cost * 1000.0 / self.cpu_budget
+        interval = max(interval, floor, self.min_ms)
+        self.interval_ms = int(min(interval, max(self.max_ms, floor)))
+        return self.interval_ms
+
+def compute_phash(img_bgr):
+    """64비트 지각 해시(pHash)를 정수로 반환 (OpenCV img_hash, 없으면 imagehash 사용)"""
+    if hasattr(cv2, 'img_hash'):
+        return int.from_bytes(cv2.img_hash.pHash(img_bgr).tobytes(), 'big')
+    bits = imagehash.phash(cv2_to_pil(img_bgr)).hash.flatten()
+    return int(''.join('1' if b else '0' for b in bits), 2)
+
+def frame_fingerprint(img_bgr):
+    """동일 프레임 판정용 지문 (고정 크기 최근접 축소본, 프레임 크기와 무관한 비용)"""
+    return cv2.resize(img_bgr, FRAME_FINGERPRINT_SIZE, interpolation=cv2.INTER_NEAREST)
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+class PageHashIndex:
+    """세션 전체 페이지 pHash 색인 (해밍 거리 다중 색인 해싱)
+
+    64비트 해시를 max_distance + 1개 조각으로 나누어 조각별 사전에 넣습니다.
+    거리가 max_distance 이하인 해시는 비둘기집 원리에 의해 적어도 한 조각이 정확히 일치하므로,
+    조각 일치 후보만 실제 거리를 계산합니다. 반복 기호나 A-B-A처럼 앞 페이지로 돌아가는 경우에도
+    이미 저장한 페이지를 찾으며, 수천 페이지에서도 조회가 수십 마이크로초 수준입니다.
+    """
+    HASH_BITS = 64
+
+    def __init__(self, max_distance=DUPLICATE_HASH_DISTANCE):
+        self.max_distance = max_distance
+        chunks = min(max_distance + 1, self.HASH_BITS)
+        # 조각별 (시프트, 마스크)
+        bounds = [self.HASH_BITS * i // chunks for i in range(chunks + 1)]
+        self.chunks = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(bounds, bounds[1:])]
+        self.tables = [{} for _ in self.chunks]
+        self.hashes = []
+        self.values = []
+
+    def __len__(self):
+        return sum(h is not None for h in self.hashes)
+
+    def add(self, page_hash, value):
+        idx = len(self.hashes)
+        self.hashes.append(page_hash)
+        self.values.append(value)
+        for table, (shift, mask) in zip(self.tables, self.chunks):
+            table.setdefault((page_hash >> shift) & mask, []).append(idx)
+
+    def remove(self, value):
+        """value로 등록한 해시를 모두 제거 (삭제한 페이지를 다시 저장할 수 있도록)"""
+        for idx, (page_hash, stored) in enumerate(zip(self.hashes, self.values)):
+            if page_hash is None or stored != value:
+                continue
+            for table, (shift, mask) in zip(self.tables, self.chunks):
+                table[(page_hash >> shift) & mask].remove(idx)
+            self.hashes[idx] = None
+            self.values[idx] = None
+
+    def find(self, page_hash, max_distance=None):
+        """max_distance 이내에서 가장 가까운 (거리, value) 반환 (없으면 None)"""
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        candidates = set()
+        for table, (shift, mask) in zip(self.tables, self.chunks):
+            candidates.update(table.get((page_hash >> shift) & mask, ()))
+        best = None
+        for idx in candidates:
+            dist = hamming_distance(page_hash, self.hashes[idx])
+            if dist <= max_distance and (best is None or dist < best[0]):
+                best = (dist, self.values[idx])
+        return best
+
+class StripStore:
+    """스크롤 캡처용 추가 전용 스트립 저장소 (메모리 맵 파일)
+
+    열 우선(column-major)으로 저장하므로 오른쪽으로 이어붙여도 기존 데이터를 옮기지 않습니다.
+    고정 크기 세그먼트 파일을 추가하며 커지므로 열린 맵이 있는 동안에도 안전합니다 (Windows 포함).
+    워커만 append하고, UI는 view()/read()로 필요한 열 범위만 읽습니다.
+    세로 스크롤(axis='vertical')은 전치한 프레임을 저장하며 (열 = 화면의 행), view()가 원래 방향으로 돌려 줍니다.
+    """
+
+    def __init__(self, height, directory, channels=3, segment_columns=STRIP_SEGMENT_COLUMNS, axis='horizontal'):
+        self.height = height
+        self.axis = axis
+        self.channels = channels
+        self.directory = directory
+        self.segment_columns = segment_columns
+        self.segments = []  # (경로, memmap[열, 행, 채널])
+        self.width = 0      # 기록이 끝난 열 수 (append 완료 후 갱신)
+
+    @property
+    def shape(self):
+        return (self.height, self.width, self.channels)
+
+    def _add_segment(self):
+        fd, path = tempfile.mkstemp(prefix="strips_", suffix=".raw", dir=self.directory)
+        os.close(fd)
+        segment = np.memmap(path, dtype=np.uint8, mode='w+',
+                            shape=(self.segment_columns, self.height, self.channels))
+        self.segments.append((path, segment))
+
+    def append(self, strip):
+        """(높이, 너비, 채널) 스트립을 오른쪽에 추가"""
+        if strip.shape[0] != self.height or strip.shape[2] != self.channels:
+            raise ValueError(f"스트립 크기가 맞지 않습니다: {strip.shape}")
+        columns = strip.transpose(1, 0, 2)
+        x, done = self.width, 0
+        while done < columns.shape[0]:
+            seg_index, offset = divmod(x + done, self.segment_columns)
+            if seg_index >= len(self.segments):
+                self._add_segment()
+            n = min(self.segment_columns - offset, columns.shape[0] - done)
+            self.segments[seg_index][1][offset:offset + n] = columns[done:done + n]
+            done += n
+        self.width = x + done
+
+    def read(self, x0, x1, limit=None):
+        """[x0, x1) 열 범위를 (높이, 너비, 채널) 연속 배열로 복사해 반환 (요청 범위만 복사)"""
+        width = self.width if limit is None else min(limit, self.width)
+        x0, x1 = max(0, x0), min(x1, width)
+        out = np.empty((self.height, max(0, x1 - x0), self.channels), dtype=np.uint8)
+        x = x0
+        while x < x1:
+            seg_index, offset = divmod(x, self.segment_columns)
+            n = min(self.segment_columns - offset, x1 - x)
+            out[:, x - x0:x - x0 + n] = self.segments[seg_index][1][offset:offset + n].transpose(1, 0, 2)
+            x += n
+        return out
+
+    def tail(self, width):
+        """마지막 width 열 (전체가 더 짧으면 전체)"""
+        return self.read(self.width - width, self.width)
+
+    def view(self):
+        """현재 너비로 고정된 읽기 전용 뷰 (이후 append의 영향을 받지 않음)"""
+        return StripView(self, self.width)
+
+    def close(self):
+        """메모리 맵을 닫고 세그먼트 파일 삭제"""
+        paths = [path for path, _ in self.segments]
+        self.segments = []  # 마지막 참조가 사라지면 맵이 해제됨
+        self.width = 0
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # 아직 맵이 열려 있는 경우 (Windows) 종료 시 임시 폴더와 함께 삭제됨
+
+class TailBuffer:
+    """이어붙인 이미지의 가장 오른쪽 N열을 유지하는 꼬리 버퍼
+
+    2N 용량 버퍼에 차례로 쓰고, 끝에 닿으면 마지막 N열만 앞으로 옮깁니다 (열당 분할상환 O(1)).
+    view()는 복사 없는 연속 열 뷰이므로 매 프레임 청크를 다시 이어붙일 필요가 없습니다.
+    """
+
+    def __init__(self, height, columns, channels=3):
+        self.columns = columns
+        shape = (height, 2 * columns) if channels == 1 else (height, 2 * columns, channels)
+        self.buffer = np.zeros(shape, dtype=np.uint8)
+        self.end = 0     # 다음에 쓸 위치
+        self.filled = 0  # 유효한 열 수 (최대 columns)
+
+    def append(self, strip):
+        w = strip.shape[1]
+        if w >= self.columns:
+            self.buffer[:, :self.columns] = strip[:, w - self.columns:]
+            self.end = self.filled = self.columns
+            return
+        if self.end + w > self.buffer.shape[1]:
+            keep = self.columns - w
+            self.buffer[:, :keep] = self.buffer[:, self.end - keep:self.end]
+            self.end = keep
+        self.buffer[:, self.end:self.end + w] = strip
+        self.end += w
+        self.filled = min(self.columns, self.filled + w)
+
+    def view(self, width=None):
+        """마지막 width 열 (채워진 만큼만) 뷰"""
+        width = self.filled if width is None else min(width, self.filled)
+        return self.buffer[:, self.end - width:self.end]
+
+class ScrollStitcher:
+    """가로 스크롤 프레임 이어붙이기 (템플릿 매칭)
+
+    모든 위치는 이어붙인 이미지(캔버스)의 열 좌표로 다룹니다. 직전 프레임의 캔버스 기준 왼쪽 끝 위치(position)를
+    유지하고, 캔버스 끝을 넘어서는 열만 새로 붙일 부분으로 판정합니다.
+    뒤로 스크롤하거나 이미 이어붙인 구간을 다시 보여 주면 아무것도 붙이지 않습니다.
+
+    기준 구간은 보통 캔버스 꼬리(회색조, 직전 프레임 폭)이고, 예측 위치가 꼬리보다 앞이면
+    캔버스 저장소에서 해당 구간을 읽습니다. 기준 구간 중 질감이 뚜렷한 구간을 템플릿으로 골라
+    새 프레임에서 찾습니다. 스크롤 속도는 거의 일정하므로 최근 이동량으로 템플릿 위치를 예측해
+    좁은 구간에서 먼저 찾고, 점수가 낮을 때만 전체 폭을 탐색합니다.
+
+    pyramid 모드에서는 축소 영상에서 위치를 추정한 뒤 원본 해상도의 몇 px 구간에서만 보정하고,
+    상관 곡선의 정점을 포물선으로 근사해 소수점 이하 위치까지 구합니다.
+
+    phase 엔진은 직전 기준 프레임과 새 프레임의 위상 상관(FFT)으로 이동량을 추정합니다.
+    비용이 탐색 범위와 무관해 초광폭 캡처 영역에 유리하며, 응답이 낮거나 원본 검증 점수가
+    낮으면 템플릿 매칭으로 넘어갑니다.
+
+    모두 실패하면 시간 예산 안에서 축소 캔버스 전체(먼 곳으로 되감은 경우), 대체 구간, ORB 특징점
+    순으로 복구를 시도하고, 연속으로 실패하면 동기화를 잃은 것으로 보고(lost) 현재 프레임을
+    새 기준으로 삼습니다.
+    """
+    HISTORY = 5
+    COARSE = 4  # 위치 재탐색용 축소 캔버스 배율 (열·행 간격)
+
+    def __init__(self, height, tail_columns=0, canvas=None, template_width=SCROLL_TEMPLATE_WIDTH,
+                 search_margin=SCROLL_SEARCH_MARGIN, align_mode=SCROLL_ALIGN_MODE,
+                 pyramid_levels=SCROLL_PYRAMID_LEVELS, engine=SCROLL_STITCH_ENGINE):
+        self.template_width = template_width
+        self.search_margin = search_margin
+        self.align_mode = align_mode
+        self.pyramid_levels = pyramid_levels
+        self.engine = engine
+        self.canvas = canvas        # 이어붙인 이미지 저장소 (StripStore, 꼬리보다 앞 구간을 읽을 때 사용)
+        self.canvas_width = 0       # append로 반영한 캔버스 너비
+        self.position = None        # 직전 프레임 왼쪽 끝의 캔버스 x (서브픽셀)
+        self.behind = False         # 직전 프레임 오른쪽 끝이 캔버스 끝보다 앞 (되감기·겹침)
+        self._phase_ref = None    # 마지막으로 위치를 찾은 프레임 (축소, float32)
+        self._phase_frame = None  # 현재 프레임 (축소, float32)
+        self._hanning = None
+        # 템플릿 구간을 고르는 범위 (빈 마디가 길어도 질감 있는 구간이 들어가도록 캡처 폭만큼)
+        self.tail_gray = TailBuffer(height, max(2 * template_width, tail_columns), channels=1)
+        self.tail_texture = TailBuffer(1, self.tail_gray.columns, channels=1)  # 열별 질감 여부 (0/1)
+        self._coarse = np.zeros((len(range(0, height, self.COARSE)), 1024), dtype=np.uint8)
+        self._coarse_width = 0
+        self._orb = None
+        self.relocated = 0   # 축소 캔버스 전체에서 위치를 다시 찾은 횟수
+        self.failures = 0    # 연속 정렬 실패 횟수
+        self.lost = False    # 동기화 잃음 상태
+        self.shifts = collections.deque(maxlen=self.HISTORY)  # 최근 프레임 간 이동량 (px, 뒤로 스크롤은 음수)
+        self.full_searches = 0  # 전체 폭 탐색 횟수
+        self.template_textured = False
+        self._appends = 0
+        self._template_key = None
+
+    def append(self, gray_part):
+        """캔버스에 이어붙인 부분의 회색조 열을 꼬리 버퍼·열별 질감·축소 캔버스에 반영"""
+        left = self.tail_gray.view(1) if self.tail_gray.filled else None
+        self.tail_texture.append(self._texture_flags(gray_part, left)[np.newaxis])
+        self.tail_gray.append(gray_part)
+        self._append_coarse(gray_part)
+        self.canvas_width += gray_part.shape[1]
+        self._appends += 1
+
+    @staticmethod
+    def _texture_flags(gray, left=None):
+        """열별 질감 여부 (가로 경계 화소가 충분한 열 1, 아니면 0)
+
+        오선처럼 가로로 이어진 선은 가로 기울기가 없어 어느 위치에나 비슷하게 맞으므로,
+        음표·기둥처럼 가로 기울기가 큰 화소의 수로 판정합니다. left는 바로 왼쪽 열입니다.
+        """
+        rows = gray[::2].astype(np.int16)
+        left = rows[:, :1] if left is None else left[::2].astype(np.int16)
+        edges = (np.abs(np.diff(np.hstack([left, rows]), axis=1)) >= SCROLL_TEXTURE_EDGE).sum(axis=0)
+        return (edges >= SCROLL_TEXTURE_PIXELS).astype(np.uint8)
+
+    def _append_coarse(self, gray_part):
+        """캔버스 x가 COARSE의 배수인 열만 골라 축소 캔버스에 추가"""
+        first = -self.canvas_width % self.COARSE
+        cols = gray_part[::self.COARSE, first::self.COARSE]
+        n = cols.shape[1]
+        if self._coarse_width + n > self._coarse.shape[1]:
+            grown = np.zeros((self._coarse.shape[0], max(2 * self._coarse.shape[1], self._coarse_width + n)),
+                             dtype=np.uint8)
+            grown[:, :self._coarse_width] = self._coarse[:, :self._coarse_width]
+            self._coarse = grown
+        self._coarse[:, self._coarse_width:self._coarse_width + n] = cols
+        self._coarse_width += n
+
+    def _reference(self, pred_left, w):
+        """예측한 프레임 위치와 겹치는 캔버스 회색조 구간 → (구간, 캔버스 x, 열별 질감 누적합)"""
+        tail_x = self.canvas_width - self.tail_gray.filled
+        if self.canvas is None or pred_left >= tail_x:
+            if self._template_key != self._appends:
+                self._textured = np.concatenate(([0], np.cumsum(self.tail_texture.view()[0], dtype=np.int32)))
+                self._template_key = self._appends
+            return self.tail_gray.view(), tail_x, self._textured
+        # 되감기: 꼬리보다 앞 구간은 캔버스 저장소에서 필요한 열만 읽음
+        x0 = max(0, int(pred_left) - self.search_margin)
+        x1 = min(self.canvas_width, int(pred_left) + w + self.search_margin)
+        ref = cv2.cvtColor(self.canvas.read(x0, x1), cv2.COLOR_BGR2GRAY)
+        return ref, x0, np.concatenate(([0], np.cumsum(self._texture_flags(ref), dtype=np.int32)))
+
+    def _select_template(self, textured, lo, hi, backward=False):
+        """기준 구간 [lo, hi)에서 질감 있는 열이 충분한 가장 좁은 구간을 템플릿으로 선택 → (시작 열, 너비)
+
+        새 프레임에서 보이지 않을 구간은 lo, hi로 제외하고, 같은 너비에서는 질감 있는 열이 가장 많은
+        구간 중 진행 방향 끝(정방향은 오른쪽, 되감기는 왼쪽)에 가장 가까운 구간을 씁니다.
+        질감 있는 구간이 없으면 (빈 마디) hi에서 끝나는 template_width 열을 쓰고 template_textured를 끕니다.
+        """
+        total = len(textured) - 1
+        lo = int(np.clip(lo, 0, max(0, total - SCROLL_TEMPLATE_MIN_WIDTH)))
+        hi = int(np.clip(hi, min(total, lo + SCROLL_TEMPLATE_MIN_WIDTH), total))
+        span = (max(lo, hi - self.template_width), min(hi - lo, self.template_width))
+        self.template_textured = False
+        if textured[hi] - textured[lo] >= SCROLL_TEMPLATE_MIN_TEXTURE:
+            for width in range(SCROLL_TEMPLATE_MIN_WIDTH, hi - lo + 1, 32):
+                counts = textured[lo + width:hi + 1] - textured[lo:hi - width + 1]
+                candidates = np.flatnonzero(counts >= SCROLL_TEMPLATE_MIN_TEXTURE)
+                if len(candidates):
+                    # 질감 있는 열이 가장 많은 구간, 같으면 진행 방향 끝에 가까운 구간
+                    best = candidates[counts[candidates] == counts[candidates].max()]
+                    span = (lo + int(best[0] if backward else best[-1]), width)
+                    self.template_textured = True
+                    break
+        return span
+
+    def predict_shift(self):
+        if not self.shifts:
+            return None
+        return int(round(np.median(self.shifts)))
+
+    @staticmethod
+    def _subpixel_offset(scores, i):
+        """정점과 양옆 점수의 포물선 근사로 소수점 이하 보정값 (-0.5 ~ 0.5)"""
+        if 0 < i < len(scores) - 1:
+            left, center, right = scores[i - 1], scores[i], scores[i + 1]
+            denom = left - 2 * center + right
+            if denom < 0:
+                return float(np.clip(0.5 * (left - right) / denom, -0.5, 0.5))
+        return 0.0
+
+    def _coarse_window(self, img_gray, template, x0, x1):
+        """축소 영상에서 위치를 추정해 원본 보정 구간 (x0, x1)으로 좁힘"""
+        scale = 1 << self.pyramid_levels
+        tw = template.shape[1]
+        if x1 - x0 - tw <= 4 * scale or tw < 8 * scale or img_gray.shape[0] < 8 * scale:
+            return x0, x1  # 탐색 구간이 이미 좁거나 너무 작은 영상
+        coarse_img = img_gray[:, x0:x1]
+        coarse_tpl = template
+        for _ in range(self.pyramid_levels):
+            coarse_img = cv2.pyrDown(coarse_img)
+            coarse_tpl = cv2.pyrDown(coarse_tpl)
+        res = cv2.matchTemplate(coarse_img, coarse_tpl, cv2.TM_CCOEFF_NORMED)
+        _, _, _, max_loc = cv2.minMaxLoc(res)
+        guess = x0 + max_loc[0] * scale
+        radius = scale + SCROLL_REFINE_RADIUS
+        return max(x0, guess - radius), min(x1, guess + radius + tw)
+
+    def _phase_shift(self, img_gray):
+        """기준 프레임 대비 가로 이동량 추정 (원본 px, 실패 시 None)"""
+        coarse = img_gray
+        for _ in range(self.pyramid_levels):
+            coarse = cv2.pyrDown(coarse)
+        self._phase_frame = np.float32(coarse)
+        ref = self._phase_ref
+        if ref is None or ref.shape != self._phase_frame.shape:
+            return None
+        if self._hanning is None or self._hanning.shape != ref.shape:
+            self._hanning = cv2.createHanningWindow((ref.shape[1], ref.shape[0]), cv2.CV_32F)
+        (dx, dy), response = cv2.phaseCorrelate(ref, self._phase_frame, self._hanning)
+        if response < SCROLL_PHASE_MIN_RESPONSE or abs(dy) > 1:
+            return None
+        return -dx * (1 << self.pyramid_levels)
+
+    def _orb_frame_left(self, img_gray, ref, ref_x):
+        """기준 구간과 새 프레임의 ORB 특징점 대응으로 프레임 왼쪽 끝의 캔버스 x 추정 (실패 시 None)"""
+        ref = np.ascontiguousarray(ref)
+        if self._orb is None:
+            self._orb = cv2.ORB_create(nfeatures=SCROLL_ORB_FEATURES)
+        kp_ref, des_ref = self._orb.detectAndCompute(ref, None)
+        kp_img, des_img = self._orb.detectAndCompute(img_gray, None)
+        if des_ref is None or des_img is None:
+            return None
+        matches = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True).match(des_ref, des_img)
+        dx = np.array([kp_img[m.trainIdx].pt[0] - kp_ref[m.queryIdx].pt[0] for m in matches
+                       if abs(kp_img[m.trainIdx].pt[1] - kp_ref[m.queryIdx].pt[1]) <= 2])
+        if len(dx) < SCROLL_ORB_MIN_INLIERS:
+            return None
+        # 가장 많은 대응이 모이는 이동량 (반복 기호로 인한 잘못된 대응은 흩어짐)
+        values, counts = np.unique(np.round(dx), return_counts=True)
+        inliers = dx[np.abs(dx - values[np.argmax(counts)]) <= 1.5]
+        if len(inliers) < SCROLL_ORB_MIN_INLIERS:
+            return None
+        return ref_x - float(inliers.mean())
+
+    def _relocate(self, img_gray, x0=0, x1=None):
+        """축소 캔버스의 [x0, x1) 구간에서 현재 프레임을 찾아 원본으로 검증 → 프레임 왼쪽 끝 캔버스 x 또는 None
+
+        되감거나 앞서 이어붙인 구간으로 건너뛴 경우 꼬리·예측 위치로는 찾을 수 없으므로,
+        캔버스 끝에 다시 붙이는(중복) 대신 기존 위치를 찾습니다. 기본값은 캔버스 전체입니다.
+        """
+        if self.canvas is None:
+            return None
+        c = self.COARSE
+        w = img_gray.shape[1]
+        block_w = min(w, 2 * self.template_width)
+        block_x = (w - block_w) // 2  # 프레임 가운데 구간
+        block = img_gray[:, block_x:block_x + block_w]
+        coarse_block = np.ascontiguousarray(block[::c, ::c])
+        x1 = self.canvas_width if x1 is None else min(x1, self.canvas_width)
+        offset = max(0, x0) // c
+        canvas = self._coarse[:, offset:min(self._coarse_width, -(-x1 // c))]
+        if canvas.shape[1] < coarse_block.shape[1] or coarse_block.shape[1] < 8:
+            return None
+        res = cv2.matchTemplate(canvas, coarse_block, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        if max_val <= SCROLL_MATCH_THRESHOLD:
+            return None
+        block_canvas_x = (offset + max_loc[0]) * c
+        radius = c + SCROLL_REFINE_RADIUS
+        x0 = max(0, block_canvas_x - radius)
+        x1 = min(self.canvas_width, block_canvas_x + block_w + radius)
+        if x1 - x0 < block_w:
+            return None
+        ref = cv2.cvtColor(self.canvas.read(x0, x1), cv2.COLOR_BGR2GRAY)
+        score, ref_pos = self._match(ref, block, 0, ref.shape[1], align_mode='direct')
+        if score < SCROLL_PREDICT_CONFIDENCE:  # 반복 마디 등 비슷한 구간과 혼동하지 않도록 엄격히 확인
+            return None
+        return x0 + ref_pos - block_x
+
+    def _refine(self, img_gray, template, guess):
+        """추정 위치 주변 몇 px 구간을 원본 해상도로 보정·검증 → (점수, 서브픽셀 x) 또는 None"""
+        w = img_gray.shape[1]
+        guess = int(round(guess))
+        radius = (1 << self.pyramid_levels) + SCROLL_REFINE_RADIUS
+        x0, x1 = max(0, guess - radius), min(w, guess + radius + template.shape[1])
+        if x1 - x0 < template.shape[1]:
+            return None
+        return self._match(img_gray, template, x0, x1, align_mode='direct')
+
+    @staticmethod
+    def _score_at(img_gray, template, x):
+        """한 위치의 정규화 상관 점수 (TM_CCOEFF_NORMED와 같은 값, 단일 위치는 직접 계산이 훨씬 빠름)"""
+        a = img_gray[:, x:x + template.shape[1]].astype(np.float32)
+        b = template.astype(np.float32)
+        a -= a.mean()
+        b -= b.mean()
+        denom = np.sqrt(float((a * a).sum()) * float((b * b).sum()))
+        return float((a * b).sum()) / denom if denom > 0 else 0.0
+
+    def _match(self, img_gray, template, x0, x1, align_mode=None):
+        """img_gray[:, x0:x1]에서 템플릿 위치 탐색 → (점수, 서브픽셀 x)"""
+        if (align_mode or self.align_mode) == 'pyramid':
+            x0, x1 = self._coarse_window(img_gray, template, x0, x1)
+        res = cv2.matchTemplate(img_gray[:, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        return max_val, x0 + max_loc[0] + self._subpixel_offset(res[0], max_loc[0])
+
+    def find_new_part(self, img_gray):
+        """새 프레임에서 새로 붙일 부분의 시작 열을 반환 (찾지 못하면 None)
+
+        반환값이 프레임 너비 이상이면 새 부분이 없는 것입니다 (멈춤, 되감기, 이미 이어붙인 구간).
+        """
+        if self.tail_gray.filled < SCROLL_TEMPLATE_MIN_WIDTH or img_gray.shape[1] < self.tail_gray.filled:
+            return None
+        result = self._align(img_gray, time.perf_counter())
+        if result is None:
+            self.failures += 1
+            self.lost = self.failures >= SCROLL_LOST_SYNC_FRAMES
+        else:
+            self.failures = 0
+            self.lost = False
+        return result
+
+    def _align(self, img_gray, started):
+        w = img_gray.shape[1]
+        # 직전 프레임 위치 (처음에는 캔버스 끝에 오른쪽 끝을 맞춘 위치)
+        base = self.position if self.position is not None else self.canvas_width - w
+        shift = self.predict_shift()
+        pred_left = base + (shift or 0)
+        ref, ref_x, textured = self._reference(pred_left, w)
+        # 새 프레임에서 보일 구간 (예측 위치에서 탐색 여유만큼 안쪽)에서만 템플릿을 고름
+        visible = int(round(pred_left)) - ref_x
+        start, width = self._select_template(textured, visible + self.search_margin,
+                                             visible + w - self.search_margin,
+                                             backward=(shift or 0) < 0)
+        template = ref[:, start:start + width]
+        # 프레임 x에서 템플릿을 찾으면 프레임 왼쪽 끝의 캔버스 x는 anchor - x
+        anchor = ref_x + start
+
+        self._phase_frame = None
+        if self.engine == 'phase':
+            phase_shift = self._phase_shift(img_gray)
+            if phase_shift is not None:
+                # 위상 상관 추정 위치를 원본 해상도의 좁은 구간에서 보정·검증
+                refined = self._refine(img_gray, template, anchor - (base + phase_shift))
+                if refined is not None and refined[0] >= SCROLL_PREDICT_CONFIDENCE:
+                    return self._accept(anchor - refined[1], w)
+
+        if shift is not None:
+            center = int(round(anchor - pred_left))
+            if not self.template_textured and 0 <= center <= w - width:
+                # 빈 마디(오선만 있는 구간)는 가로 위치가 모호하므로 예측 위치의 점수부터 확인
+                score = self._score_at(img_gray, template, center)
+                if score >= SCROLL_PREDICT_CONFIDENCE:
+                    return self._accept(anchor - center, w)
+            x0 = max(0, center - self.search_margin)
+            x1 = min(w, center + self.search_margin + width)
+            if x1 - x0 >= width:
+                score, match_x = self._match(img_gray, template, x0, x1)
+                if score >= SCROLL_PREDICT_CONFIDENCE:
+                    return self._accept(anchor - match_x, w)
+
+        # 예측이 없거나 신뢰도가 낮으면 전체 폭 탐색
+        self.full_searches += 1
+        score, match_x = self._match(img_gray, template, 0, w)
+        if score <= SCROLL_MATCH_THRESHOLD and self.align_mode == 'pyramid':
+            # 축소 영상에서 위치를 잘못 잡았을 수 있으므로 원본 전체로 재확인
+            score, match_x = self._match(img_gray, template, 0, w, align_mode='direct')
+        if score > SCROLL_MATCH_THRESHOLD:
+            return self._accept(anchor - match_x, w)
+
+        # 복구 1: 스크롤 방향이 바뀐 경우 직전 위치 주변에서 위치를 다시 찾음 (좁은 구간이라 예산과 무관)
+        found = self._relocate(img_gray, int(base) - 2 * w, int(base) + 3 * w)
+        if found is not None:
+            self.relocated += 1
+            # 예측 이력을 새 방향의 이동량으로 다시 시작
+            self.shifts.clear()
+            return self._accept(found, w)
+
+        # 복구 2: 멀리 되감은 경우 축소 캔버스 전체에서 위치를 다시 찾음
+        # (동기화를 잃기 직전 프레임은 중복으로 다시 붙이기 전에 예산과 관계없이 한 번 확인)
+        if self._within_budget(started) or self.failures + 1 >= SCROLL_LOST_SYNC_FRAMES:
+            found = self._relocate(img_gray)
+            if found is not None:
+                self.relocated += 1
+                self.shifts.clear()
+                return self._accept(found, w, jumped=True)
+
+        # 복구 3: 템플릿 구간이 가려졌을 수 있으므로 템플릿 옆의 넓은 쪽 구간으로 탐색
+        alt_width = 2 * self.template_width
+        left = (max(0, start - alt_width), start)
+        right = (start + width, min(ref.shape[1], start + width + alt_width))
+        alt_start, alt_end = max(left, right, key=lambda r: r[1] - r[0])
+        if self._within_budget(started) and alt_end - alt_start >= SCROLL_TEMPLATE_MIN_WIDTH:
+            score, alt_x = self._match(img_gray, ref[:, alt_start:alt_end], 0, w)
+            if score > SCROLL_MATCH_THRESHOLD:
+                return self._accept(ref_x + alt_start - alt_x, w)
+
+        # 복구 4: ORB 특징점 대응으로 위치 추정 후 원본에서 검증
+        if self._within_budget(started):
+            frame_left = self._orb_frame_left(img_gray, ref, ref_x)
+            if frame_left is not None:
+                refined = self._refine(img_gray, template, anchor - frame_left)
+                if refined is not None and refined[0] > SCROLL_MATCH_THRESHOLD:
+                    return self._accept(anchor - refined[1], w)
+        return None
+
+    @staticmethod
+    def _within_budget(started):
+        return (time.perf_counter() - started) * 1000.0 < SCROLL_RECOVERY_BUDGET_MS
+
+    def reanchor(self, img_gray):
+        """동기화를 잃었을 때 현재 프레임을 캔버스 끝에 새 기준으로 붙임 (이어붙이기 재시작)"""
+        self.position = float(self.canvas_width)
+        self.append(img_gray)
+        self.shifts.clear()
+        self.behind = False
+        self._phase_ref = self._phase_frame
+        self.failures = 0
+        self.lost = False
+
+    def _accept(self, frame_left, w, jumped=False):
+        """찾은 프레임 위치를 기록하고 새로 붙일 부분의 시작 열을 반환"""
+        if not jumped:
+            base = self.position if self.position is not None else self.canvas_width - w
+            self.shifts.append(frame_left - base)
+        self.position = frame_left
+        self.behind = frame_left + w < self.canvas_width - 0.5
+        if self._phase_frame is not None:
+            self._phase_ref = self._phase_frame
+        return max(0, int(round(self.canvas_width - frame_left)))
+
+class StripView:
+    """StripStore의 고정 너비 뷰 (image[:, a:b] 형태의 열 슬라이스 지원)
+
+    세로 스크롤 저장소는 원래 방향 (저장한 열 = 행)으로 보이며 image[a:b] 형태의 행 슬라이스를 지원합니다.
+    """
+
+    def __init__(self, store, width):
+        self.store = store
+        self.width = width
+
+    @property
+    def axis(self):
+        return self.store.axis
+
+    @property
+    def shape(self):
+        if self.store.axis == 'vertical':
+            return (self.width, self.store.height, self.store.channels)
+        return (self.store.height, self.width, self.store.channels)
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        if self.store.axis == 'vertical':
+            rows, cols = cols, rows  # 저장소 좌표 (열 = 행)
+        x0, x1, step = cols.indices(self.width)
+        if step != 1:
+            raise IndexError("열 간격 슬라이스는 지원하지 않습니다.")
+        strip = self.store.read(x0, x1, self.width)[rows]
+        if self.store.axis == 'vertical':
+            return np.ascontiguousarray(strip.transpose(1, 0, 2))
+        return strip
+
+    def read(self, x0, x1):
+        return self.store.read(x0, x1, self.width)
+
+class PersistWorker(QObject):
+    """캡처 파이프라인의 저장 단계 (write-behind)
+
+    UI는 PENDING_WRITES에 등록된 메모리 이미지를 바로 사용하고,
+    PNG 인코딩/쓰기는 이 스레드에서 나중에 수행합니다. 임시 파일이므로 fsync하지 않습니다.
+    """
+    error_occurred = Signal(str)
+
+    def __init__(self, persist_queue, metrics):
+        super().__init__()
+        self.persist_queue = persist_queue
+        self.metrics = metrics
+
+    def process_next(self):
+        item = self.persist_queue.get()
+        if item is None:
+            return
+        started = time.perf_counter()
+        filename, img = item['filename'], item['image']
+        try:
+            if PENDING_WRITES.get(filename) is not img:
+                return  # 쓰기 전에 삭제(취소)됐거나 같은 경로에 더 새 이미지가 등록됨
+            if imwrite_unicode(filename, img):
+                if not PENDING_WRITES.discard(filename, img) and PENDING_WRITES.get(filename) is None:
+                    # 쓰는 도중 삭제된 페이지는 파일을 남기지 않음
+                    try:
+                        os.remove(filename)
+                    except OSError:
+                        pass
+            else:
+                # 실패한 이미지는 메모리에 남겨 두어 편집/내보내기에서 계속 사용 가능
+                self.error_occurred.emit(f"저장 오류: {os.path.basename(filename)}")
+        finally:
+            self.metrics.record("persist", time.perf_counter() - started)
+            self.persist_queue.task_done()
+
 class CaptureWorker(QObject):
     """캡처 및 이미지 처리를 담당하는 워커 스레드"""
     finished_processing = Signal()
-    request_clean_capture = Signal()
     image_saved = Signal(str, object)  # filename, img_bgr
-    scroll_updated = Signal(object)    # img_bgr
+    scroll_updated = Signal(object, object)  # StripStore (읽기 전용으로 공유), 새로 붙인 스트립 (저장소 좌표)
     status_updated = Signal(str)
     error_occurred = Signal(str)
+    change_map_updated = Signal(object)  # 블록별 변화 맵 정보 (dict)
+    frame_analyzed = Signal(bool, float) # 화면 변화(페이지 전환/스크롤) 감지 여부, 프레임 처리 시간(초)
+    persist_requested = Signal()         # 저장 단계 큐에 항목 추가됨
 
     def __init__(self):
         super().__init__()
+        self.frame_queue = None      # MainWindow가 채우는 FrameQueue
+        self.persist_queue = None    # 저장 단계(PersistWorker)로 넘기는 FrameQueue (block 정책)
+        self.store_ext = ".png"      # 이번 세션의 임시 캡처 파일 형식
+        self.metrics = None          # StageMetrics
         self.last_captured_gray = None
-        self.last_hash = None
-        self.scroll_chunks = []
-        self.total_scroll_width = 0
+        self.change_detector = FrameChangeDetector()
+        # 변화가 감지된 프레임을 바로 저장하지 않고, 다음 프레임과 비교해 화면이 멈췄을 때 저장
+        # (페이지 넘김 애니메이션·페이드 중간 화면 저장 방지)
+        self.settle_detector = FrameChangeDetector()
+        self.settling = False
+        self.page_index = PageHashIndex()  # 세션 내 저장된 페이지 pHash 색인
+        self.last_saved_filename = None    # 마지막으로 저장한 페이지 (삭제 시 비교 기준 초기화)
+        self.strip_store = None  # 스크롤 모드 이어붙인 이미지 (첫 프레임에서 생성)
+        self.stitcher = None     # 스크롤 이어붙이기 (템플릿 매칭, 이동량 예측)
+        self.last_fingerprint = None  # 스크롤 모드 직전 프레임 지문 (멈춤 감지)
         self.capture_counter = 0
 
     def reset_state(self):
         self.last_captured_gray = None
-        self.last_hash = None
-        self.scroll_chunks = []
-        self.total_scroll_width = 0
+        self.change_detector.reset()
+        self.settle_detector.reset()
+        self.settling = False
+        self.page_index = PageHashIndex()
+        self.last_saved_filename = None
+        # 이전 저장소는 UI(다시 자르기)가 계속 사용할 수 있으므로 닫지 않고 참조만 놓음
+        self.strip_store = None
+        self.stitcher = None
+        self.last_fingerprint = None
         self.capture_counter = 0
 
-    def _get_tail(self, width):
-        """마지막 청크들로부터 지정된 너비만큼의 이미지를 구성하여 반환"""
-        if not self.scroll_chunks:
-            return None
-        current_width = 0
-        tail_chunks = []
-        for chunk in reversed(self.scroll_chunks):
-            tail_chunks.insert(0, chunk)
-            current_width += chunk.shape[1]
-            if current_width >= width:
-                break
-        if not tail_chunks:
-            return None
-        tail_img = np.hstack(tail_chunks)
-        if tail_img.shape[1] > width:
-            return tail_img[:, -width:]
-        return tail_img
-
-    def process_frame(self, img_bgr, mode_index, sensitivity):
+    def set_ignore_regions(self, regions):
+        """페이지 모드 변화 감지에서 제외할 영역 설정 (비율 좌표 리스트)"""
+        self.change_detector.set_ignore_regions(regions)
+        self.settle_detector.set_ignore_regions(regions)
+
+    def set_store_format(self, ext):
+        """임시 캡처 파일 형식 설정 ('.png' 또는 CAPTURE_STORE_EXT)"""
+        self.store_ext = ext
+
+    def remove_pages(self, paths):
+        """UI에서 삭제한 페이지를 중복 색인에서 제거
+
+        마지막으로 저장한 페이지를 지웠으면 비교 기준도 지워 현재 화면을 다시 저장할 수 있게 합니다.
+        """
+        for path in paths:
+            self.page_index.remove(path)
+        if self.last_saved_filename in paths:
+            self.last_saved_filename = None
+            self.last_captured_gray = None
+            self.change_detector.reset()
+
+    def process_next_frame(self):
+        """프레임 큐에서 하나를 꺼내 처리 (프레임 추가 시그널마다 호출)"""
+        frame = self.frame_queue.get() if self.frame_queue else None
+        if frame is None:
+            return  # 정책에 의해 이미 버려진 프레임
+        img_bgr = frame['image']
+        grab_cost = frame['grab_cost']
+        if self.metrics:
+            self.metrics.record("grab", grab_cost)
+        started = time.perf_counter()
+        self.process_frame(img_bgr, frame['mode'], frame['sensitivity'], grab_cost)
+        if self.metrics:
+            self.metrics.record("analyze", time.perf_counter() - started)
+        self.frame_queue.task_done()
+
+    def process_frame(self, img_bgr, mode_index, sensitivity, grab_cost=0.0):
+        started = time.perf_counter()
         try:
             if mode_index == 0:  # 페이지 넘김 모드
                 # 테두리 크롭 (비교 정확도 향상)
@@ -2692,6 +4453,7 @@ class CaptureWorker(QObject):
                     img_proc = img_bgr[border_crop:-border_crop, border_crop:-border_crop]
                 else:
                     img_proc = img_bgr
+                    border_crop = 0
 
                 img_gray = cv2.cvtColor(img_proc, cv2.COLOR_BGR2GRAY)
                 should_save = False
@@ -2699,49 +4461,102 @@ class CaptureWorker(QObject):
                 if self.last_captured_gray is None:
                     should_save = True
                 else:
-                    if self.last_captured_gray.shape == img_gray.shape:
-                        score = calculate_ssim(self.last_captured_gray, img_gray)
-                        if score < sensitivity:
-                            should_save = True
-                    else:
-                        should_save = True
+                    # 블록별 SSIM 맵으로 판정 (제외 영역은 무시)
+                    should_save = self.change_detector.is_changed(img_gray, sensitivity, border=border_crop)
+                    if self.change_detector.change_map is not None:
+                        self.change_map_updated.emit({
+                            'map': self.change_detector.change_map.copy(),
+                            'valid': self.change_detector.block_valid.copy(),
+                            'fraction': self.change_detector.changed_fraction,
+                            'sensitivity': sensitivity
+                        })
+
+                if should_save and self.last_captured_gray is not None:
+                    # 직전 프레임과도 같아야(화면이 멈춰야) 저장, 아직 바뀌는 중이면 이 프레임을 새 비교 대상으로
+                    settled = self.settling and not self.settle_detector.is_changed(img_gray, sensitivity,
+                                                                                   border=border_crop)
+                    self.settle_detector.set_reference(img_gray)
+                    self.settling = not settled
+                    should_save = settled
+                else:
+                    self.settling = False  # 전환이 되돌아간 경우 대기 취소
+
+                self.frame_analyzed.emit(should_save or self.settling or self.change_detector.changed_fraction > 0,
+                                         grab_cost + time.perf_counter() - started)
 
                 if should_save:
-                    self.request_clean_capture.emit()
-                    # 저장 완료될 때까지 finished_processing을 보내지 않음 (Main에서 save_clean 호출 대기)
+                    # 인디케이터가 캡처 영역 밖에 있으므로 분석한 프레임을 그대로 저장
+                    # (save_clean_image가 finished_processing을 보냄)
+                    self.save_clean_image(img_bgr)
                 else:
                     self.finished_processing.emit()
 
-            else:  # 스크롤 모드
-                if not self.scroll_chunks:
-                    self.scroll_chunks.append(img_bgr)
-                    self.total_scroll_width = img_bgr.shape[1]
+            else:  # 스크롤 모드 (1: 가로, 2: 세로)
+                is_scrolling = False
+                # 재생을 멈춘 동안은 직전 프레임과 같으므로 정렬을 건너뜀
+                fingerprint = frame_fingerprint(img_bgr)
+                if (self.strip_store is not None and self.last_fingerprint is not None
+                        and np.array_equal(fingerprint, self.last_fingerprint)):
+                    if self.metrics:
+                        self.metrics.increment("scroll_identical_skip")
+                    self.frame_analyzed.emit(False, grab_cost + time.perf_counter() - started)
+                    self.finished_processing.emit()
+                    return
+                self.last_fingerprint = fingerprint
+                # 캡처 도중 모드를 바꿔도 이미 시작한 저장소의 방향을 유지
+                if self.strip_store is not None:
+                    axis = self.strip_store.axis
+                else:
+                    axis = 'vertical' if mode_index == 2 else 'horizontal'
+                if axis == 'vertical':
+                    # 세로 스크롤은 전치해 같은 가로 이어붙이기 경로 사용 (열 = 화면의 행)
+                    img_bgr = cv2.transpose(img_bgr)
+                size_label = "전체 높이" if axis == 'vertical' else "전체 폭"
+                img_gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+                if self.strip_store is None:
+                    self.strip_store = StripStore(img_bgr.shape[0], OUTPUT_FOLDER, axis=axis)
+                    self.strip_store.append(img_bgr)
+                    self.stitcher = ScrollStitcher(img_bgr.shape[0], tail_columns=img_bgr.shape[1],
+                                                   canvas=self.strip_store)
+                    self.stitcher.append(img_gray)
                     self.status_updated.emit("스크롤 캡처 시작 (버퍼링...)")
-                    self.scroll_updated.emit(img_bgr)
+                    self.scroll_updated.emit(self.strip_store, img_bgr)
                 else:
-                    # 템플릿 매칭
-                    template_width = 200
-                    tail_img = self._get_tail(template_width)
-                    
-                    if tail_img is not None and tail_img.shape[1] >= template_width and img_bgr.shape[1] >= template_width:
-                        template = tail_img[:, -template_width:]
-                        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-                        img_gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-
-                        res = cv2.matchTemplate(img_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-                        _, max_val, _, max_loc = cv2.minMaxLoc(res)
-
-                        if max_val > 0.7:
-                            match_x = max_loc[0]
-                            new_part_start = match_x + template_width
-                            if new_part_start < img_bgr.shape[1]:
-                                new_part = img_bgr[:, new_part_start:]
-                                if new_part.shape[1] > 0:
-                                    self.scroll_chunks.append(new_part)
-                                    self.total_scroll_width += new_part.shape[1]
-                                    self.status_updated.emit(f"이어붙이기 중... (전체 폭: {self.total_scroll_width}px)")
-                                    self.scroll_updated.emit(new_part)
+                    # 템플릿 매칭 (예측 구간 우선, 신뢰도가 낮으면 전체 폭)
+                    full_searches, relocated = self.stitcher.full_searches, self.stitcher.relocated
+                    new_part_start = self.stitcher.find_new_part(img_gray)
+                    if self.metrics and self.stitcher.full_searches > full_searches:
+                        self.metrics.increment("scroll_full_search", self.stitcher.full_searches - full_searches)
+                    if self.metrics and self.stitcher.relocated > relocated:
+                        self.metrics.increment("scroll_relocate")
+                    if new_part_start is not None and new_part_start < img_bgr.shape[1]:
+                        new_part = img_bgr[:, new_part_start:]
+                        self.strip_store.append(new_part)
+                        self.stitcher.append(img_gray[:, new_part_start:])
+                        self.status_updated.emit(f"이어붙이기 중... ({size_label}: {self.strip_store.width}px)")
+                        self.scroll_updated.emit(self.strip_store, new_part)
+                        is_scrolling = True
+                    elif new_part_start is not None and self.stitcher.behind:
+                        # 되감기·겹침: 이미 이어붙인 구간이므로 위치만 기록하고 붙이지 않음
+                        if self.metrics:
+                            self.metrics.increment("scroll_overlap")
+                        self.status_updated.emit(
+                            f"이미 이어붙인 구간 ({int(self.stitcher.position)}px 위치) - 새 부분 없음")
+                        is_scrolling = bool(self.stitcher.shifts) and abs(self.stitcher.shifts[-1]) >= 1
+                    elif new_part_start is None and self.stitcher.lost:
+                        # 화면이 건너뜀(줄 바꿈, 빠른 탐색) → 이어지는 부분이 없으므로 현재 화면부터 다시 이어붙임
+                        self.strip_store.append(img_bgr)
+                        self.stitcher.reanchor(img_gray)
+                        if self.metrics:
+                            self.metrics.increment("scroll_reanchor")
+                        self.status_updated.emit(f"동기화 잃음 → 현재 화면부터 다시 이어붙이기 ({size_label}: {self.strip_store.width}px)")
+                        self.scroll_updated.emit(self.strip_store, img_bgr)
+                        is_scrolling = True
+                    elif new_part_start is None:
+                        self.status_updated.emit(
+                            f"스크롤 정렬 실패 ({self.stitcher.failures}/{SCROLL_LOST_SYNC_FRAMES}) - 동기화 확인 중...")
                 
+                self.frame_analyzed.emit(is_scrolling, grab_cost + time.perf_counter() - started)
                 self.finished_processing.emit()
         except Exception as e:
             self.error_occurred.emit(f"이미지 처리 오류: {e}")
@@ -2749,27 +4564,38 @@ class CaptureWorker(QObject):
 
     def save_clean_image(self, img_bgr):
         try:
-            # 해시 비교 (중복 저장 방지)
-            pil_img = Image.fromarray(cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB))
-            curr_hash = imagehash.phash(pil_img)
+            # 해시 비교: 세션의 모든 저장 페이지와 비교 (중복 저장 방지)
+            curr_hash = compute_phash(img_bgr)
+            duplicate = self.page_index.find(curr_hash, DUPLICATE_HASH_DISTANCE)
+
+            # 다음 비교를 위해 크롭된 그레이스케일 저장
+            # (앞 페이지로 돌아간 경우에도 현재 화면을 기준으로 삼아 같은 페이지를 반복 판정하지 않음)
+            h, w = img_bgr.shape[:2]
+            border_crop = 5
+            if w > 2 * border_crop and h > 2 * border_crop:
+                clean_proc = img_bgr[border_crop:-border_crop, border_crop:-border_crop]
+            else:
+                clean_proc = img_bgr
+            self.last_captured_gray = cv2.cvtColor(clean_proc, cv2.COLOR_BGR2GRAY)
+            self.change_detector.set_reference(self.last_captured_gray)
 
-            if self.last_hash is None or (curr_hash - self.last_hash > 5):
+            if duplicate is not None:
+                self.status_updated.emit(f"이미 저장한 페이지입니다 ({os.path.basename(duplicate[1])}), 건너뜀")
+            else:
                 self.capture_counter += 1
-                filename = os.path.join(OUTPUT_FOLDER, f"score_{self.capture_counter:03d}.png")
-                imwrite_unicode(filename, img_bgr)
-                
-                # 다음 비교를 위해 크롭된 그레이스케일 저장
-                h, w = img_bgr.shape[:2]
-                border_crop = 5
-                if w > 2 * border_crop and h > 2 * border_crop:
-                    clean_proc = img_bgr[border_crop:-border_crop, border_crop:-border_crop]
-                else:
-                    clean_proc = img_bgr
-                
-                self.last_captured_gray = cv2.cvtColor(clean_proc, cv2.COLOR_BGR2GRAY)
-                self.last_hash = curr_hash
-                
-                self.image_saved.emit(filename, img_bgr)
+                filename = os.path.join(OUTPUT_FOLDER, f"score_{self.capture_counter:03d}{self.store_ext}")
+                self.page_index.add(curr_hash, filename)
+                self.last_saved_filename = filename
+
+                if self.persist_queue is not None:
+                    # 인코딩/쓰기는 저장 단계로 넘기고 UI에는 메모리 이미지로 바로 알림
+                    # (저장 단계가 가득 차 있으면 자리가 날 때까지 대기)
+                    PENDING_WRITES.add(filename, img_bgr)
+                    self.persist_queue.put({'filename': filename, 'image': img_bgr})
+                    self.persist_requested.emit()
+                    self.image_saved.emit(filename, img_bgr)
+                elif imwrite_unicode(filename, img_bgr):
+                    self.image_saved.emit(filename, img_bgr)
             
         except Exception as e:
             self.error_occurred.emit(f"저장 오류: {e}")
@@ -2933,9 +4759,12 @@ def check_screen_recording_permission():
 
 class MainWindow(QMainWindow):
     # 워커 스레드 통신용 시그널
-    sig_process_frame = Signal(object, int, float)
-    sig_save_clean = Signal(object)
+    sig_frame_queued = Signal()
+    sig_persist = Signal()
     sig_reset_worker = Signal()
+    sig_set_ignore_regions = Signal(object)
+    sig_set_store_format = Signal(str)
+    sig_remove_pages = Signal(object)
 
     def __init__(self):
         super().__init__()
@@ -2957,13 +4786,20 @@ class MainWindow(QMainWindow):
         self.last_system_theme = self.current_theme
 
         self.countdown_value = -1
-        self.current_scroll_chunks = [] # UI 표시용 청크 리스트
+        self.scroll_store = None # 스크롤 모드 이어붙인 이미지 (워커의 StripStore, 읽기 전용)
+        self.preview_tail = None # 스크롤 미리보기용 컬러 꼬리 버퍼
         self.current_scroll_filename = None
         self.last_stitched_image = None
         self.last_cut_points = None
-        self.is_worker_busy = False
+        self.frame_queue = FrameQueue()
+        self.store_ext = ".png"  # 현재 캡처 세션의 임시 파일 형식
+        self.persist_queue = FrameQueue(PERSIST_QUEUE_SIZE, FrameQueue.BLOCK)
+        self.stage_metrics = StageMetrics()
+        self.capture_scheduler = CaptureScheduler()
+        self.capture_plan = None  # 선택 영역용 멀티 모니터 캡처 계획 (화면 구성 변경 시 폐기)
+        self.ignore_regions = []   # 페이지 모드 변화 감지 제외 영역 (비율 좌표)
+        self.last_change_info = None
         self.is_easter_egg_active = False
-        self.is_first_capture = False
 
         self.font_bold_family = "Arial"
         self.font_regular_family = "Arial"
@@ -2972,6 +4808,7 @@ class MainWindow(QMainWindow):
         self.setup_ui()
         self.apply_stylesheet()
         self.setup_worker()
+        self.watch_screen_changes()
         
         # 업데이트 확인 (GitHub Releases)
         self.update_checker = UpdateChecker()
@@ -3076,24 +4913,39 @@ class MainWindow(QMainWindow):
             self.btn_select.setStyleSheet("")
 
     def setup_worker(self):
-        """워커 스레드 초기화"""
+        """워커 스레드 초기화 (캡처 → 분석 → 저장 단계별 스레드)"""
         self.worker_thread = QThread()
         self.worker = CaptureWorker()
         self.worker.moveToThread(self.worker_thread)
+        self.worker.frame_queue = self.frame_queue
+        self.worker.persist_queue = self.persist_queue
+        self.worker.metrics = self.stage_metrics
+
+        self.persist_thread = QThread()
+        self.persist_worker = PersistWorker(self.persist_queue, self.stage_metrics)
+        self.persist_worker.moveToThread(self.persist_thread)
+        self.capture_backend = QtCaptureBackend()
         
         # 시그널 연결
-        self.sig_process_frame.connect(self.worker.process_frame)
-        self.sig_save_clean.connect(self.worker.save_clean_image)
+        self.sig_frame_queued.connect(self.worker.process_next_frame)
         self.sig_reset_worker.connect(self.worker.reset_state)
+        self.sig_set_ignore_regions.connect(self.worker.set_ignore_regions)
+        self.sig_set_store_format.connect(self.worker.set_store_format)
+        self.sig_remove_pages.connect(self.worker.remove_pages)
         
         self.worker.finished_processing.connect(self.on_worker_finished)
-        self.worker.request_clean_capture.connect(self.on_request_clean_capture)
         self.worker.image_saved.connect(self.on_image_saved)
         self.worker.scroll_updated.connect(self.on_scroll_updated)
         self.worker.status_updated.connect(self.status_label.setText)
         self.worker.error_occurred.connect(self.show_error_message)
+        self.worker.change_map_updated.connect(self.on_change_map_updated)
+        self.worker.frame_analyzed.connect(self.on_frame_analyzed)
+        self.worker.persist_requested.connect(self.persist_worker.process_next)
+        self.sig_persist.connect(self.persist_worker.process_next)
+        self.persist_worker.error_occurred.connect(self.show_error_message)
         
         self.worker_thread.start()
+        self.persist_thread.start()
 
     def load_fonts(self):
         """폰트 파일 로드"""
@@ -3249,8 +5101,15 @@ class MainWindow(QMainWindow):
         mode_layout = QHBoxLayout()
         mode_layout.addWidget(QLabel("모드:"))
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["페이지 넘김 (기본)", "가로 스크롤 (이어붙이기)"])
+        self.mode_combo.addItems(["페이지 넘김 (기본)", "가로 스크롤 (이어붙이기)", "세로 스크롤 (이어붙이기)"])
         mode_layout.addWidget(self.mode_combo, 1)
+
+        self.btn_ignore = QPushButton("제외 영역")
+        self.btn_ignore.setToolTip("페이지 넘김 감지에서 제외할 영역 (타이머, 재생 커서 등)")
+        self.btn_ignore.setMinimumHeight(28)
+        self.btn_ignore.setEnabled(False)
+        self.btn_ignore.clicked.connect(self.edit_ignore_regions)
+        mode_layout.addWidget(self.btn_ignore)
         control_layout.addLayout(mode_layout)
 
         # 설정 (가로 배치)
@@ -3277,6 +5136,27 @@ class MainWindow(QMainWindow):
         
         control_layout.addLayout(settings_h)
 
+        # 프레임 큐 정책 (처리가 캡처 주기를 못 따라갈 때)
+        queue_layout = QHBoxLayout()
+        queue_layout.addWidget(QLabel("밀린 프레임:"))
+        self.queue_policy_combo = QComboBox()
+        for policy, label in FrameQueue.POLICIES.items():
+            self.queue_policy_combo.addItem(label, policy)
+        self.queue_policy_combo.setCurrentIndex(self.queue_policy_combo.findData(self.frame_queue.policy))
+        self.queue_policy_combo.setToolTip("분석이 캡처 주기를 따라가지 못할 때 대기 프레임 처리 방식")
+        self.queue_policy_combo.currentIndexChanged.connect(self.change_queue_policy)
+        queue_layout.addWidget(self.queue_policy_combo, 1)
+
+        queue_layout.addWidget(QLabel("임시 저장:"))
+        self.store_format_combo = QComboBox()
+        self.store_format_combo.addItem("PNG", ".png")
+        if zstandard is not None:
+            self.store_format_combo.addItem("빠른 무손실", CAPTURE_STORE_EXT)
+            self.store_format_combo.setCurrentIndex(1)
+        self.store_format_combo.setToolTip("캡처 중 임시 파일 형식 (빠른 무손실: zstd 압축, 저장/미리보기가 더 빠름)")
+        queue_layout.addWidget(self.store_format_combo)
+        control_layout.addLayout(queue_layout)
+
         # 투명도 조절
         opacity_layout = QHBoxLayout()
         opacity_layout.addWidget(QLabel("투명도:"))
@@ -3408,6 +5288,11 @@ class MainWindow(QMainWindow):
         self.status_label.setWordWrap(True)
         left_layout.addWidget(self.status_label)
 
+        self.queue_label = QLabel("")
+        self.queue_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.queue_label.setStyleSheet("color: #888; font-size: 11px;")
+        left_layout.addWidget(self.queue_label)
+
         # --- 오른쪽 패널 (대형 미리보기 및 에디터) ---
         self.right_stack = QStackedWidget()
         
@@ -3596,9 +5481,36 @@ class MainWindow(QMainWindow):
         self.overlay.start()
         self.status_label.setText("영역 선택 중...")
 
+    def watch_screen_changes(self):
+        """화면 추가/제거 및 해상도·배율 변경 시 캡처 계획 폐기"""
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._watch_screen)
+        app.screenAdded.connect(self.invalidate_capture_plan)
+        app.screenRemoved.connect(self.invalidate_capture_plan)
+        app.primaryScreenChanged.connect(self.invalidate_capture_plan)
+        for screen in app.screens():
+            self._watch_screen(screen)
+
+    def _watch_screen(self, screen):
+        screen.geometryChanged.connect(self.invalidate_capture_plan)
+        screen.physicalDotsPerInchChanged.connect(self.invalidate_capture_plan)
+        screen.logicalDotsPerInchChanged.connect(self.invalidate_capture_plan)
+
+    def invalidate_capture_plan(self, *args):
+        self.capture_plan = None
+
+    def grab_capture_area(self):
+        """선택 영역 캡처 → BGR 배열 (미리 계산된 캡처 계획을 캡처 백엔드로 캡처)"""
+        area = self.capture_area_dict
+        if self.capture_plan is None or not self.capture_plan.matches(area['left'], area['top'], area['width'], area['height']):
+            self.capture_plan = CapturePlan(area['left'], area['top'], area['width'], area['height'])
+        return self.capture_backend.grab(self.capture_plan)
+
     def finish_selection(self, area_dict):
         self.show() # 메인 윈도우 복구
         self.capture_area_dict = area_dict
+        self.capture_plan = CapturePlan(area_dict['left'], area_dict['top'],
+                                        area_dict['width'], area_dict['height'])
         
         # 선택 영역 표시 위젯 생성
         if self.area_indicator:
@@ -3609,8 +5521,29 @@ class MainWindow(QMainWindow):
         )
         
         self.btn_capture.setEnabled(True)
+        self.btn_ignore.setEnabled(True)
+        # 영역이 바뀌면 이전 제외 영역은 의미가 없으므로 초기화
+        self.ignore_regions = []
+        self.last_change_info = None
+        self.sig_set_ignore_regions.emit([])
         self.update_ui_state()
         self.status_label.setText(f"영역 설정됨 ({area_dict['width']}×{area_dict['height']})")
+
+    def edit_ignore_regions(self):
+        """변화 감지 제외 영역 편집 다이얼로그 표시"""
+        if not self.capture_area_dict:
+            return
+        pixmap = cv2_to_qpixmap(self.grab_capture_area())
+        pixmap.setDevicePixelRatio(self.capture_plan.dpr)
+        dlg = IgnoreRegionDialog(pixmap, self.ignore_regions, self.last_change_info, self)
+        if dlg.exec() == QDialog.DialogCode.Accepted:
+            self.ignore_regions = dlg.get_regions()
+            self.sig_set_ignore_regions.emit(list(self.ignore_regions))
+            self.status_label.setText(f"제외 영역 {len(self.ignore_regions)}개 적용됨")
+
+    def on_change_map_updated(self, info):
+        """페이지 모드: 최근 블록 변화 맵 보관 (제외 영역 편집 시 표시)"""
+        self.last_change_info = info
         
     def on_selection_cancelled(self):
         self.show()
@@ -3636,10 +5569,11 @@ class MainWindow(QMainWindow):
             self.btn_mini.setChecked(False)
             self.toggle_mini_mode(False)
 
+        self.flush_writes()
         files = self.get_ordered_files()
         if not files:
             return
-        
+
         self.editor_widget.load_preview(files)
         self.right_stack.setCurrentIndex(1)
         self.status_label.setText("PDF 편집 모드")
@@ -3686,16 +5620,24 @@ class MainWindow(QMainWindow):
         self.captured_files = []
         self.list_widget.clear()
         self.btn_reslice.hide()
+        if self.last_stitched_image is not None:
+            self.last_stitched_image.store.close()
         self.last_stitched_image = None
         self.image_preview_label.setText("캡처 진행 중...")
         self.current_original_pixmap = None
         self.update_mini_preview()
-        self.current_scroll_chunks = []
+        self.scroll_store = None
+        self.preview_tail = None
         self.current_scroll_filename = None
         self.sig_reset_worker.emit()
+        # 임시 파일 형식은 캡처 세션마다 고정
+        self.store_ext = self.store_format_combo.currentData()
+        self.sig_set_store_format.emit(self.store_ext)
+        self.frame_queue.reset()
+        self.stage_metrics.reset()
+        self.update_queue_status()
         self.editor_widget.clear_image_cache()
-        self.is_first_capture = True
-        
+
         if not os.path.exists(OUTPUT_FOLDER):
             os.makedirs(OUTPUT_FOLDER)
 
@@ -3721,26 +5663,30 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(1000, self.run_countdown)
         else:
             self.status_label.setText("캡처 진행 중")
-            self.capture_timer.start(1000)
+            self.capture_scheduler.reset()
+            self.capture_timer.start(self.capture_scheduler.interval_ms)
 
     def stop_capture(self):
         self.is_capturing = False
         self.capture_timer.stop()
+        self.frame_queue.clear()
+        self.update_queue_status()
         self.update_ui_state()
         
         if self.area_indicator:
             self.area_indicator.set_color(QColor(0, 255, 0)) # 초록색 (대기 중)
         
         # 스크롤 모드: 캡처 종료 시 일괄 자르기 수행
-        if self.mode_combo.currentIndex() == 1 and self.current_scroll_chunks:
+        if self.mode_combo.currentIndex() != 0 and self.scroll_store is not None and self.scroll_store.width:
             self.status_label.setText("편집 창을 여는 중...")
             QApplication.processEvents()
             
-            full_img = np.hstack(self.current_scroll_chunks)
+            # 전체 이미지를 만들지 않고 저장소 뷰를 그대로 사용
+            full_img = self.scroll_store.view()
             self.last_stitched_image = full_img
             self.btn_reslice.show()
             
-            dlg = ScrollSlicerDialog(full_img, self.capture_area_dict['width'], self)
+            dlg = ScrollSlicerDialog(full_img, self._scroll_slice_length(full_img.axis), self, axis=full_img.axis)
             if dlg.exec() == QDialog.DialogCode.Accepted:
                 self.last_cut_points = dlg.canvas.cut_points
                 sliced_images = dlg.get_sliced_images()
@@ -3751,7 +5697,7 @@ class MainWindow(QMainWindow):
             else:
                 self.status_label.setText("스크롤 캡처 취소됨")
             
-            self.current_scroll_chunks = []
+            self.scroll_store = None
 
         self.btn_select.setEnabled(True)
         self.btn_pdf.setEnabled(len(self.captured_files) > 0)
@@ -3762,8 +5708,8 @@ class MainWindow(QMainWindow):
     def _save_image_to_list(self, img):
         """이미지를 저장하고 리스트에 추가하는 내부 함수"""
         self.capture_counter += 1
-        filename = os.path.join(OUTPUT_FOLDER, f"score_scroll_{self.capture_counter:03d}.png")
-        imwrite_unicode(filename, img)
+        filename = os.path.join(OUTPUT_FOLDER, f"score_scroll_{self.capture_counter:03d}{self.store_ext}")
+        self.write_behind(filename, img)
         self.captured_files.append(filename)
         self.is_saved = False
         
@@ -3773,6 +5719,12 @@ class MainWindow(QMainWindow):
         self.list_widget.scrollToBottom()
         self.display_image(filename)
 
+    def _scroll_slice_length(self, axis):
+        """스크롤 캡처 조각 하나의 목표 길이 (캡처 영역의 스크롤 방향 크기, 영역이 없으면 0)"""
+        if not self.capture_area_dict:
+            return 0
+        return self.capture_area_dict['height' if axis == 'vertical' else 'width']
+
     def reslice_last_scroll(self):
         if self.last_stitched_image is None:
             return
@@ -3793,8 +5745,9 @@ class MainWindow(QMainWindow):
             
             should_clear = (reply == QMessageBox.StandardButton.Yes)
         
-        width = self.capture_area_dict['width'] if self.capture_area_dict else self.last_stitched_image.shape[1]
-        dlg = ScrollSlicerDialog(self.last_stitched_image, width, self, initial_points=self.last_cut_points)
+        axis = self.last_stitched_image.axis
+        width = self._scroll_slice_length(axis) or self.last_stitched_image.width
+        dlg = ScrollSlicerDialog(self.last_stitched_image, width, self, initial_points=self.last_cut_points, axis=axis)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self.last_cut_points = dlg.canvas.cut_points
             # 기존 이미지 삭제 로직 수행
@@ -3803,6 +5756,8 @@ class MainWindow(QMainWindow):
                 for i in range(self.list_widget.count()):
                     item = self.list_widget.item(i)
                     path = item.data(Qt.ItemDataRole.UserRole)
+                    if path:
+                        PENDING_WRITES.cancel(path)
                     if path and os.path.exists(path):
                         try:
                             os.remove(path)
@@ -3823,85 +5778,112 @@ class MainWindow(QMainWindow):
             self.switch_to_editor()
 
     def perform_capture(self):
-        if not self.capture_area_dict or self.is_worker_busy:
+        if not self.capture_area_dict:
             return
-        
-        self.is_worker_busy = True
-        # 캡처 영역 크기 가져오기
-        w, h = self.capture_area_dict['width'], self.capture_area_dict['height']
-            
-        try:
-            is_scroll_mode = (self.mode_combo.currentIndex() == 1)
 
-            # 스크롤 모드일 경우: 캡처 전 인디케이터 숨김
-            if is_scroll_mode and self.area_indicator:
-                self.area_indicator.hide()
-                
-                wait_time = 0.5 if self.is_first_capture else 0.2
-                t_end = time.time() + wait_time
-                while time.time() < t_end:
-                    QApplication.processEvents()
-                    time.sleep(0.01)
-                if self.is_first_capture: self.is_first_capture = False
-
-            # 화면 캡처 (Global Coordinates)
-            pixmap = grab_screen_area(self.capture_area_dict['left'], self.capture_area_dict['top'], w, h)
-            
-            # 스크롤 모드일 경우: 캡처 후 인디케이터 복구
-            if is_scroll_mode and self.area_indicator:
-                self.area_indicator.show()
-
-            # QPixmap -> OpenCV 변환 (Main Thread)
-            img_bgr = qpixmap_to_cv(pixmap)
-            
-            # 워커 스레드로 처리 위임
-            mode = self.mode_combo.currentIndex()
+        try:
+            mode = self.mode_combo.currentIndex()  # 0: 페이지 넘김, 1: 가로 스크롤, 2: 세로 스크롤
             try:
                 sensitivity = float(self.sensitivity_input.text())
             except ValueError:
                 sensitivity = float(DEFAULT_SENSITIVITY)
-            self.sig_process_frame.emit(img_bgr, mode, sensitivity)
-            
+
+            frame = {'image': None, 'area': dict(self.capture_area_dict),
+                     'mode': mode, 'sensitivity': sensitivity, 'grab_cost': 0.0}
+
+            # 인디케이터는 캡처 영역 밖에 그려지므로 숨기거나 기다리지 않고 한 번만 캡처
+            # 화면 캡처 (Global Coordinates, Main Thread)
+            started = time.perf_counter()
+            frame['image'] = self.grab_capture_area()
+            frame['grab_cost'] = time.perf_counter() - started
+
+            # 워커 스레드로 처리 위임 (큐가 차면 정책에 따라 버림)
+            if self.frame_queue.put(frame):
+                self.sig_frame_queued.emit()
+            self.update_queue_status()
+
         except Exception as e:
             show_message(self, "캡처 오류", f"화면 캡처 중 오류가 발생했습니다:\n{e}", QMessageBox.Icon.Critical)
             self.status_label.setText(f"캡처 오류")
-            self.is_worker_busy = False
 
     def on_worker_finished(self):
         """워커 처리 완료 시 호출"""
-        self.is_worker_busy = False
+        self.update_queue_status()
+
+    def update_queue_status(self):
+        """프레임 큐 집계 표시 (처리/버림/대기 시간, 단계별 처리 시간)"""
+        st = self.frame_queue.stats()
+        rejected = f" · 거부 {st['rejected']}" if st['rejected'] else ""
+        self.queue_label.setText(
+            f"프레임 {st['processed']}/{st['enqueued']} · 버림 {st['dropped']}{rejected} · "
+            f"대기 {st['avg_wait_ms']:.0f}ms (최대 {st['max_wait_ms']:.0f}ms)")
+        names = {"grab": "캡처", "analyze": "분석", "persist": "저장"}
+        lines = [f"{names[stage]}: 평균 {m['avg_ms']:.1f}ms · 최대 {m['max_ms']:.1f}ms ({m['count']}회)"
+                 for stage, m in self.stage_metrics.snapshot().items()]
+        lines.append(f"저장 대기: {self.persist_queue.stats()['pending']}개")
+        counters = self.stage_metrics.counters()
+        if counters.get("scroll_full_search"):
+            lines.append(f"스크롤 전체 폭 재탐색: {counters['scroll_full_search']}회")
+        if counters.get("scroll_overlap"):
+            lines.append(f"이미 이어붙인 구간 (되감기·겹침): {counters['scroll_overlap']}프레임")
+        if counters.get("scroll_relocate"):
+            lines.append(f"스크롤 위치 재탐색 성공: {counters['scroll_relocate']}회")
+        if counters.get("scroll_reanchor"):
+            lines.append(f"스크롤 동기화 잃음 → 다시 시작: {counters['scroll_reanchor']}회")
+        if counters.get("scroll_identical_skip"):
+            lines.append(f"스크롤 멈춤(동일 프레임) 건너뜀: {counters['scroll_identical_skip']}회")
+        self.queue_label.setToolTip("\n".join(lines))
+
+    def change_queue_policy(self, index):
+        self.frame_queue.set_policy(self.queue_policy_combo.itemData(index))
+
+    def on_frame_analyzed(self, is_active, cost):
+        """프레임 분석 결과에 따라 캡처 주기 조절"""
+        interval = self.capture_scheduler.update(is_active, cost)
+        if self.capture_timer.isActive() and self.capture_timer.interval() != interval:
+            self.capture_timer.setInterval(interval)
+        self.status_label.setToolTip(f"캡처 주기: {interval}ms ({self.capture_scheduler.current_rate:.1f}회/초)")
 
     def show_error_message(self, message):
         show_message(self, "오류", message, QMessageBox.Icon.Warning)
 
-    def on_request_clean_capture(self):
-        """페이지 모드: 변화 감지 시 깨끗한 이미지 캡처 요청"""
-        if not self.capture_area_dict:
-            self.is_worker_busy = False
-            return
+    def write_behind(self, filename, img):
+        """저장 단계 스레드에 쓰기를 맡기고 메모리 이미지를 바로 사용할 수 있게 등록
 
-        # 인디케이터 숨기고 캡처
-        if self.area_indicator:
-            self.area_indicator.hide()
-            
-            wait_time = 0.5 if self.is_first_capture else 0.1
-            t_end = time.time() + wait_time
-            while time.time() < t_end:
-                QApplication.processEvents()
-                time.sleep(0.01)
-            if self.is_first_capture: self.is_first_capture = False
+        GUI 스레드는 block 정책으로 대기하면 안 되므로 크기 제한 없이 넘깁니다 (이미지는 이미 메모리에 있음).
+        """
+        PENDING_WRITES.add(filename, img)
+        self.persist_queue.put_nowait({'filename': filename, 'image': img})
+        self.sig_persist.emit()
 
-        pixmap_clean = grab_screen_area(self.capture_area_dict['left'], self.capture_area_dict['top'], 
-                                       self.capture_area_dict['width'], self.capture_area_dict['height'])
-        
-        if self.area_indicator:
-            self.area_indicator.show()
-        
-        img_bgr_clean = qpixmap_to_cv(pixmap_clean)
-        self.sig_save_clean.emit(img_bgr_clean)
+    def flush_writes(self, timeout=PERSIST_FLUSH_TIMEOUT):
+        """대기 중인 쓰기가 디스크에 기록될 때까지 진행 표시와 함께 대기 (편집/내보내기/종료 전)
+
+        시간 초과 시 False를 반환합니다. 남은 이미지는 PENDING_WRITES에서 계속 읽을 수 있습니다.
+        """
+        if self.persist_queue.join(timeout=0.1):
+            return True
+        total = self.persist_queue.stats()['pending'] + 1  # 대기 중 + 쓰는 중
+        progress = QProgressDialog("이미지 저장을 마무리하는 중...", None, 0, total, self)
+        progress.setWindowTitle("저장 중")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setCancelButton(None)
+        apply_window_theme(progress, self)
+        progress.show()
+        deadline = time.perf_counter() + timeout
+        done = False
+        while not done and time.perf_counter() < deadline:
+            progress.setValue(max(0, total - self.persist_queue.stats()['pending'] - 1))
+            QApplication.processEvents()
+            done = self.persist_queue.join(timeout=0.05)
+        progress.close()
+        if not done:
+            self.status_label.setText("저장이 지연되고 있습니다 (메모리 이미지로 계속 진행)")
+        return done
 
     def on_image_saved(self, filename, img_bgr):
-        """이미지 저장 완료 후 UI 업데이트"""
+        """이미지 저장 완료 후 UI 업데이트 (파일 쓰기는 아직 진행 중일 수 있음)"""
         self.captured_files.append(filename)
         self.is_saved = False
         item = QListWidgetItem(os.path.basename(filename))
@@ -3909,30 +5891,22 @@ class MainWindow(QMainWindow):
         self.list_widget.addItem(item)
         self.list_widget.scrollToBottom()
         
-        self.display_image(filename)
+        self.display_cv_image(img_bgr)
         self.btn_pdf.setEnabled(True)
         
         count = len(self.captured_files)
         self.status_label.setText(f"캡처 완료 (총 {count}개)")
 
-    def on_scroll_updated(self, new_part):
+    def on_scroll_updated(self, store, new_part):
         """스크롤 모드: 버퍼 업데이트 시 미리보기 갱신"""
-        self.current_scroll_chunks.append(new_part)
-        # 미리보기: 전체 이미지가 아닌 최근 캡처 영역만큼만 표시
+        self.scroll_store = store
+        # 미리보기: 전체 이미지가 아닌 최근 캡처 영역만큼만 표시 (저장소 좌표로 유지 후 원래 방향으로 표시)
         if self.capture_area_dict:
-            w = self.capture_area_dict['width']
-            current_w = 0
-            tail_parts = []
-            for part in reversed(self.current_scroll_chunks):
-                tail_parts.insert(0, part)
-                current_w += part.shape[1]
-                if current_w >= w:
-                    break
-            if tail_parts:
-                preview_img = np.hstack(tail_parts)
-                if preview_img.shape[1] > w:
-                    preview_img = preview_img[:, -w:]
-                self.display_cv_image(preview_img)
+            if self.preview_tail is None:
+                self.preview_tail = TailBuffer(new_part.shape[0], self._scroll_slice_length(store.axis))
+            self.preview_tail.append(new_part)
+            tail = self.preview_tail.view()
+            self.display_cv_image(cv2.transpose(tail) if store.axis == 'vertical' else tail)
         
         self.btn_pdf.setEnabled(True)
 
@@ -3950,8 +5924,11 @@ class MainWindow(QMainWindow):
         self.update_mini_preview()
 
     def display_image(self, filepath):
-        if os.path.exists(filepath):
-            self.current_original_pixmap = QPixmap(filepath)
+        pending = PENDING_WRITES.get(filepath)
+        if pending is not None:
+            self.display_cv_image(pending)
+        elif os.path.exists(filepath):
+            self.current_original_pixmap = load_qpixmap(filepath)
             self.update_preview_label()
             self.update_mini_preview()
 
@@ -3986,12 +5963,12 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
 
     def get_ordered_files(self):
-        """리스트 위젯의 순서대로 파일 경로 반환"""
+        """리스트 위젯의 순서대로 파일 경로 반환 (아직 쓰는 중인 파일 포함)"""
         files = []
         for i in range(self.list_widget.count()):
             item = self.list_widget.item(i)
             path = item.data(Qt.ItemDataRole.UserRole)
-            if path and os.path.exists(path):
+            if path and image_exists(path):
                 files.append(path)
         return files
 
@@ -4007,17 +5984,23 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
+        removed = []
         for item in items:
             row = self.list_widget.row(item)
             self.list_widget.takeItem(row)
             full_path = item.data(Qt.ItemDataRole.UserRole)
+            removed.append(full_path)
             
             if full_path in self.captured_files:
                 self.captured_files.remove(full_path)
+            # 아직 저장 대기 중이면 쓰기를 취소 (나중에 파일이 다시 생기지 않도록)
+            PENDING_WRITES.cancel(full_path)
             if os.path.exists(full_path):
                 try:
                     os.remove(full_path)
                 except: pass
+        # 삭제한 페이지는 다시 캡처할 수 있도록 워커의 중복 색인에서도 제거
+        self.sig_remove_pages.emit(removed)
             
         if self.list_widget.count() == 0:
             self.image_preview_label.clear()
@@ -4040,7 +6023,9 @@ class MainWindow(QMainWindow):
                            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
                            QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.current_scroll_chunks = []
+            self.scroll_store = None
+            if self.last_stitched_image is not None:
+                self.last_stitched_image.store.close()
             self.last_stitched_image = None
             self.last_cut_points = None
             self.btn_reslice.hide()
@@ -4072,6 +6057,7 @@ class MainWindow(QMainWindow):
         self.switch_to_editor()
 
     def generate_pdf_final(self, metadata):
+        self.flush_writes()
         files = self.get_ordered_files()
         if not files:
             return
@@ -4167,7 +6153,7 @@ class MainWindow(QMainWindow):
                         else:
                             cv_img = imread_unicode(f)
                             if cv_img is not None:
-                                cv_img = enhance_score_image(cv_img, use_basic=False, use_high=True)
+                                cv_img = enhance_score_image(cv_img, use_basic=False, use_high=True, concurrency=1)
                                 cached_path = self.editor_widget._save_to_cache(cv_img, f, 'hq')
                                 if cached_path:
                                     self.editor_widget.hq_cache[f] = cached_path
@@ -4177,7 +6163,7 @@ class MainWindow(QMainWindow):
                         else:
                             cv_img = imread_unicode(f)
                             if cv_img is not None:
-                                cv_img = enhance_score_image(cv_img, use_basic=True, use_high=False)
+                                cv_img = enhance_score_image(cv_img, use_basic=True, use_high=False, concurrency=1)
                                 cached_path = self.editor_widget._save_to_cache(cv_img, f, 'basic')
                                 if cached_path:
                                     self.editor_widget.basic_cache[f] = cached_path
@@ -4193,12 +6179,14 @@ class MainWindow(QMainWindow):
 
                         if invert_score:
                             processed = cv2.bitwise_not(processed)
-                        image_objects.append(Image.fromarray(cv2.cvtColor(processed, cv2.COLOR_BGR2RGB)))
+                        image_objects.append(cv2_to_pil(processed))
                 else:
-                    img = Image.open(f).convert("RGB")
+                    img = load_pil_image(f)
                     if invert_score:
                         img = ImageOps.invert(img)
                     image_objects.append(img)
+            if use_high:
+                SR_MODEL_POOL.log_stats()
 
             if not image_objects:
                 self.status_label.setText("처리할 이미지가 없습니다.")
@@ -4207,10 +6195,13 @@ class MainWindow(QMainWindow):
 
             # 원본 이미지 너비 확인 (비율 계산용)
             raw_width = 1000
-            if files and os.path.exists(files[0]):
+            if files and image_exists(files[0]):
                 try:
-                    with Image.open(files[0]) as tmp:
-                        raw_width = tmp.width
+                    if is_capture_store_path(files[0]) or PENDING_WRITES.get(files[0]) is not None:
+                        raw_width = imread_unicode(files[0]).shape[1]
+                    else:
+                        with Image.open(files[0]) as tmp:
+                            raw_width = tmp.width
                 except: pass
 
             # 기준 해상도 보정 (최소 A4 300DPI 수준 확보)
@@ -4490,6 +6481,11 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'worker_thread'):
             self.worker_thread.quit()
             self.worker_thread.wait()
+            self.flush_writes()
+            self.persist_thread.quit()
+            self.persist_thread.wait()
+            self.capture_backend.close()
+        SR_MODEL_POOL.clear()
 
         # 프로그램 종료 시 임시 폴더 및 파일 정리
         if os.path.exists(OUTPUT_FOLDER):